@@ -118,11 +118,16 @@ async def get_agent(openai_api_key: str, server_url: str) -> MCPAgent:
 
     Note:
         The agent will be created and initialized on first call.
-        Subsequent calls return the existing instance.
+        Subsequent calls return the existing instance unless the API key
+        or server URL changed.
     """
     global _global_agent
 
-    if _global_agent is None:
+    if (
+        _global_agent is None
+        or _global_agent.openai_api_key != openai_api_key
+        or _global_agent.server_url != server_url
+    ):
         _global_agent = MCPAgent(openai_api_key, server_url)
         await _global_agent.initialize()
 
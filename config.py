@@ -27,14 +27,20 @@ Usage:
 """
 
 import os
-from typing import Optional
-from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 from dotenv import load_dotenv
 import logging
 
 # Configure logging to never log sensitive data
 logger = logging.getLogger(__name__)
 
+# .env lives next to this module (same file load_dotenv() would discover)
+_ENV_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
+
+# Docker secrets mount point
+_SECRETS_DIR = "/run/secrets"
+
 
 class Config:
     """Centralized configuration management for API keys and secrets.
@@ -48,47 +54,120 @@ class Config:
     All methods are static to provide easy access throughout the application.
     """
 
-    # Load environment variables on module import
-    _env_loaded = False
+    # ENVIRONMENT == "production", computed whenever .env is loaded
+    _is_production: bool = False
+
+    # Docker secret contents by key name (or None when absent); secrets are
+    # immutable for the lifetime of a container, so misses are cached too
+    _secret_cache: dict[str, Optional[str]] = {}
+
+    # Last validate_config() report; reset by clear_cache()/reload_env()
+    _validation_cache: Optional[Mapping[str, Any]] = None
+
+    # Keys reported on by validate_config()
+    _KNOWN_KEYS = ("OPENAI_API_KEY", "TAVILY_API_KEY", "MCP_SERVER_URL")
+
+    # Secret file for each known key (the lowercased key name)
+    _SECRET_PATHS = {name: f"{_SECRETS_DIR}/{name.lower()}" for name in _KNOWN_KEYS}
 
     @classmethod
-    def _ensure_env_loaded(cls) -> None:
-        """Ensure .env file is loaded exactly once."""
-        if not cls._env_loaded:
-            load_dotenv()
-            cls._env_loaded = True
-            logger.info("Environment variables loaded")
-
-    @staticmethod
-    def is_production() -> bool:
+    def _load_env(cls, override: bool = False) -> None:
+        """Load the .env file (if any) into the environment.
+
+        Runs at module import and from reload_env(). The isfile guard skips dotenv's
+        directory search when there is no .env file, e.g. in containers.
+
+        Args:
+            override: Whether .env values replace existing variables
+        """
+        if os.path.isfile(_ENV_FILE):
+            load_dotenv(_ENV_FILE, override=override)
+        cls._is_production = (
+            os.environ.get("ENVIRONMENT", "development").lower() == "production"
+        )
+        logger.info("Environment variables loaded")
+
+    @classmethod
+    def reload_env(cls) -> None:
+        """Re-read the .env file and discard cached secrets.
+
+        Keys are looked up in os.environ on every call, so runtime changes to
+        the environment need no reload. This picks up variables newly added
+        to .env and re-reads Docker secrets; as at startup, variables already
+        set in the environment take priority over .env.
+        """
+        cls._load_env()
+        cls.clear_cache()
+        cls._preload_keys()
+
+    @classmethod
+    def _preload_keys(cls) -> None:
+        """Read the known keys' Docker secrets up front when running in production.
+
+        Secrets do not change for the lifetime of a container, so reading them
+        once at startup keeps the filesystem out of every later
+        get_openai_key() etc. Development mode stays lazy.
+        """
+        if not cls._is_production:
+            return
+        for key_name in cls._KNOWN_KEYS:
+            cls._read_docker_secret(key_name)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget cached Docker secrets and the validation report.
+
+        Intended for tests and for callers that change secrets at runtime and
+        need the next lookup to hit the underlying sources again.
+        """
+        cls._secret_cache.clear()
+        cls._validation_cache = None
+
+    @classmethod
+    def is_production(cls) -> bool:
         """Check if running in production environment.
 
+        Evaluated when the environment is loaded; see reload_env().
+
         Returns:
             True if ENVIRONMENT is set to 'production', False otherwise
         """
-        return os.getenv("ENVIRONMENT", "development").lower() == "production"
+        return cls._is_production
 
-    @staticmethod
-    def _read_docker_secret(secret_name: str) -> Optional[str]:
+    @classmethod
+    def _read_docker_secret(cls, key_name: str) -> Optional[str]:
         """Read secret from Docker secrets directory.
 
         Docker secrets are mounted at /run/secrets/ in containerized environments.
         This method safely attempts to read secrets without raising errors if
-        they don't exist.
+        they don't exist. The outcome, including a miss, is cached so the
+        filesystem is only touched once per secret.
 
         Args:
-            secret_name: Name of the secret file to read
+            key_name: Key whose secret to read; the secret file is the
+                lowercased key name (e.g. 'openai_api_key')
 
         Returns:
             Secret value if found, None otherwise
         """
-        secret_path = Path(f"/run/secrets/{secret_name}")
-        if secret_path.exists():
+        if key_name in cls._secret_cache:
+            return cls._secret_cache[key_name]
+
+        value = None
+        secret_path = cls._SECRET_PATHS.get(key_name)
+        if secret_path is None:
+            secret_path = f"{_SECRETS_DIR}/{key_name.lower()}"
+        if os.path.exists(secret_path):
             try:
-                return secret_path.read_text().strip()
+                with open(secret_path, "rb") as f:
+                    value = f.read().decode().strip()
             except Exception as e:
-                logger.warning(f"Failed to read Docker secret {secret_name}: {e}")
-        return None
+                # Don't cache I/O failures; the next call retries the read
+                logger.warning("Failed to read Docker secret %s: %s", secret_path, e)
+                return None
+
+        cls._secret_cache[key_name] = value
+        return value
 
     @classmethod
     def get_api_key(
@@ -104,6 +183,9 @@ class Config:
         2. Environment variables (from .env file or system)
         3. User input (only if allow_user_input=True)
 
+        Docker secrets are cached per key name; the environment and user
+        input are checked on every call, and user input is never stored.
+
         Args:
             key_name: Environment variable name (e.g., 'OPENAI_API_KEY')
             user_input: Optional user-provided key as fallback
@@ -119,26 +201,24 @@ class Config:
             >>> Config.get_api_key("OPENAI_API_KEY", allow_user_input=False)
             'sk-proj-...'  # Only from env or Docker secrets
         """
-        cls._ensure_env_loaded()
-
         # Priority 1: Docker secrets (production)
-        docker_secret = cls._read_docker_secret(key_name.lower())
+        docker_secret = cls._read_docker_secret(key_name)
         if docker_secret:
-            logger.info(f"API key '{key_name}' loaded from Docker secrets")
+            logger.info("API key '%s' loaded from Docker secrets", key_name)
             return docker_secret
 
         # Priority 2: Environment variables
-        env_value = os.getenv(key_name)
+        env_value = os.environ.get(key_name)
         if env_value:
-            logger.info(f"API key '{key_name}' loaded from environment variables")
+            logger.info("API key '%s' loaded from environment variables", key_name)
             return env_value
 
         # Priority 3: User input (only in development or if explicitly allowed)
         if allow_user_input and user_input:
-            logger.info(f"API key '{key_name}' provided by user input")
+            logger.info("API key '%s' provided by user input", key_name)
             return user_input
 
-        logger.warning(f"API key '{key_name}' not found in any source")
+        logger.warning("API key '%s' not found in any source", key_name)
         return None
 
     @classmethod
@@ -184,14 +264,79 @@ class Config:
         return cls.get_api_key("MCP_SERVER_URL", user_input=user_input)
 
     @classmethod
-    def validate_config(cls) -> dict:
+    def get_setting(
+        cls, key_name: str, default: str, choices: Optional[tuple[str, ...]] = None
+    ) -> str:
+        """Get a non-secret setting from the environment.
+
+        Args:
+            key_name: Environment variable name (e.g., 'EMBED_BACKEND')
+            default: Value used when the variable is unset or invalid
+            choices: Allowed values (case-insensitive), or None for any value
+
+        Returns:
+            The setting (lowercased when choices are given), or default
+        """
+        value = os.environ.get(key_name, "").strip()
+        if not value:
+            return default
+        if choices is None:
+            return value
+        if value.lower() in choices:
+            return value.lower()
+
+        logger.warning(
+            "Setting '%s' must be one of %s; using '%s'",
+            key_name,
+            ", ".join(choices),
+            default,
+        )
+        return default
+
+    @classmethod
+    def get_int_setting(cls, key_name: str, default: int, minimum: int = 1) -> int:
+        """Get a non-secret integer setting from the environment.
+
+        Args:
+            key_name: Environment variable name (e.g., 'OPENAI_MAX_CONC')
+            default: Value used when the variable is unset or invalid
+            minimum: Smallest accepted value
+
+        Returns:
+            The setting, or default if it isn't an integer >= minimum
+        """
+        value = os.environ.get(key_name, "").strip()
+        if not value:
+            return default
+        try:
+            number = int(value)
+        except ValueError:
+            number = None
+        if number is not None and number >= minimum:
+            return number
+
+        logger.warning(
+            "Setting '%s' must be an integer >= %d; using %d",
+            key_name,
+            minimum,
+            default,
+        )
+        return default
+
+    @classmethod
+    def validate_config(cls) -> Mapping[str, Any]:
         """Validate that required configuration is present.
 
         Checks for the presence of critical API keys and returns a
-        status report.
+        status report. All keys are checked in one pass against a single
+        listing of the Docker secrets directory and the environment;
+        user input is not considered.
+
+        The report is computed once and cached until reload_env() or
+        clear_cache() is called.
 
         Returns:
-            Dictionary with validation results:
+            Read-only mapping with validation results:
             {
                 'openai_key_present': bool,
                 'tavily_key_present': bool,
@@ -199,14 +344,39 @@ class Config:
                 'environment': str
             }
         """
-        cls._ensure_env_loaded()
-
-        return {
-            "openai_key_present": bool(cls.get_openai_key()),
-            "tavily_key_present": bool(cls.get_tavily_key()),
-            "mcp_server_url_present": bool(cls.get_mcp_server_url()),
-            "environment": "production" if cls.is_production() else "development",
-        }
+        if cls._validation_cache is not None:
+            return cls._validation_cache
+
+        # One directory listing instead of a stat() per key
+        try:
+            with os.scandir(_SECRETS_DIR) as entries:
+                secret_files = {entry.name for entry in entries}
+        except OSError:
+            secret_files = set()
+
+        present = {}
+        for key_name in cls._KNOWN_KEYS:
+            if os.path.basename(cls._SECRET_PATHS[key_name]) in secret_files:
+                from_secret = cls._read_docker_secret(key_name)
+            else:
+                cls._secret_cache[key_name] = None
+                from_secret = None
+            present[key_name] = bool(from_secret or os.environ.get(key_name))
+
+        cls._validation_cache = MappingProxyType(
+            {
+                "openai_key_present": present["OPENAI_API_KEY"],
+                "tavily_key_present": present["TAVILY_API_KEY"],
+                "mcp_server_url_present": present["MCP_SERVER_URL"],
+                "environment": "production" if cls.is_production() else "development",
+            }
+        )
+        return cls._validation_cache
+
+
+# Load .env once on import so lookups never need to check for it
+Config._load_env()
+Config._preload_keys()
 
 
 # Convenience function for backward compatibility
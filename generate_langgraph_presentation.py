@@ -8,22 +8,150 @@ Requirements:
     pip install python-pptx
 
 Usage:
-    python generate_langgraph_presentation.py
+    python generate_langgraph_presentation.py [--force]
+
+    The deck is only rebuilt when this script is newer than the existing
+    output file; pass --force to rebuild unconditionally.
 
 Output:
     langgraph_agents_presentation.pptx
 """
 
+import argparse
+import os
+import sys
+from io import BytesIO
+
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
 
+OUTPUT_FILE = "langgraph_agents_presentation.pptx"
+
+# Every color used in the deck, built once
+_PAL = {
+    "blue": RGBColor(0, 102, 204),  # titles and headings
+    "red": RGBColor(204, 0, 0),  # code identifiers
+    "grey": RGBColor(50, 50, 50),  # outlines and arrows
+    "green": RGBColor(100, 200, 100),  # START nodes
+    "node": RGBColor(100, 150, 255),  # graph nodes
+    "stop": RGBColor(255, 100, 100),  # END nodes
+    "tool": RGBColor(255, 180, 100),  # tool nodes
+    "alt": RGBColor(240, 240, 240),  # alternate table rows
+    "white": RGBColor(255, 255, 255),  # text on blue
+    "orange": RGBColor(255, 140, 0),  # ReAct headings
+    "annot": RGBColor(200, 0, 0),  # diagram annotations
+}
+
+# List markers, defined once so every slide uses the same glyphs
+_BULLET = "• "
+_CHECK = "✓ "
+_DIAMOND = "🔹 "
+_ARROW = "→ "
+
+# Buffer size for writing the finished .pptx to disk
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Point sizes used throughout, built once instead of per paragraph
+_PT = {
+    size: Pt(size)
+    for size in (0, 2, 2.5, 4, 6, 8, 10, 11, 12, 13, 14, 15, 16, 18, 20, 22, 24, 32, 44)
+}
+
+
+def _style_paragraph(p, size, bold=False, color=None, name=None, align=None):
+    """Apply font styling to a paragraph in one call.
+
+    The paragraph's font proxy is fetched once and only the properties that
+    are given get written, so unset ones keep inheriting from the layout.
+    """
+    font = p.font
+    font.size = _PT[size]
+    if bold:
+        font.bold = True
+    if color is not None:
+        font.color.rgb = color
+    if name is not None:
+        font.name = name
+    if align is not None:
+        p.alignment = align
+
+
+def _next_paragraph(tf):
+    """Return the text frame's empty first paragraph, or append a new one."""
+    paragraphs = tf.paragraphs
+    if len(paragraphs) == 1 and not paragraphs[0].text:
+        return paragraphs[0]
+    return tf.add_paragraph()
+
+
+def _add_bullets(
+    tf,
+    items,
+    head_size,
+    body_size,
+    head_space,
+    body_space,
+    head_color=None,
+    head_name=None,
+):
+    """Write (heading, description) pairs as bold headings over indented text.
+
+    Shared by the feature, node, field and step list slides, which all use
+    this two-level layout and only differ in sizes, spacing and colors.
+    """
+    for heading, description in items:
+        p = _next_paragraph(tf)
+        p.text = heading
+        _style_paragraph(p, head_size, bold=True, color=head_color, name=head_name)
+        p.space_after = _PT[head_space]
+
+        p = tf.add_paragraph()
+        p.text = description
+        _style_paragraph(p, body_size)
+        p.level = 1
+        p.space_after = _PT[body_space]
+
+
+def _add_title_box(slide, text):
+    """Add the large blue heading used on blank-layout slides."""
+    title_box = slide.shapes.add_textbox(
+        Inches(0.5), Inches(0.3), Inches(9), Inches(0.6)
+    )
+    title_frame = title_box.text_frame
+    title_frame.text = text
+    _style_paragraph(title_frame.paragraphs[0], 32, bold=True, color=_PAL["blue"])
+    return title_box
+
+
+def _add_node(
+    slide, left, top, width, height, fill_rgb, text, font_size, line_width=None
+):
+    """Add a rounded-rectangle diagram node with bold, centered text."""
+    shape = slide.shapes.add_shape(
+        MSO_SHAPE.ROUNDED_RECTANGLE, left, top, width, height
+    )
+    shape.fill.solid()
+    shape.fill.fore_color.rgb = fill_rgb
+    line = shape.line
+    line.color.rgb = _PAL["grey"]
+    if line_width is not None:
+        line.width = line_width
+
+    text_frame = shape.text_frame
+    text_frame.text = text
+    text_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
+    _style_paragraph(
+        text_frame.paragraphs[0], font_size, bold=True, align=PP_ALIGN.CENTER
+    )
+    return shape
+
 
-def create_title_slide(prs):
+def create_title_slide(prs, title_layout):
     """Create title slide."""
-    slide = prs.slides.add_slide(prs.slide_layouts[0])
+    slide = prs.slides.add_slide(title_layout)
     title = slide.shapes.title
     subtitle = slide.placeholders[1]
 
@@ -31,27 +159,23 @@ def create_title_slide(prs):
     subtitle.text = "LLM Bootcamp Project\nAgentic RAG & ReAct Agents"
 
     # Style title
-    title.text_frame.paragraphs[0].font.size = Pt(44)
-    title.text_frame.paragraphs[0].font.bold = True
-    title.text_frame.paragraphs[0].font.color.rgb = RGBColor(0, 102, 204)
+    _style_paragraph(title.text_frame.paragraphs[0], 44, bold=True, color=_PAL["blue"])
 
 
-def create_overview_slide(prs):
+def create_overview_slide(prs, content_layout):
     """Create overview slide."""
-    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    slide = prs.slides.add_slide(content_layout)
     title = slide.shapes.title
     title.text = "Overview"
 
     content = slide.placeholders[1]
     tf = content.text_frame
-    tf.clear()
 
     # Add content
     p = tf.paragraphs[0]
     p.text = "Two Main LangGraph Implementations:"
-    p.font.size = Pt(24)
-    p.font.bold = True
-    p.space_after = Pt(20)
+    _style_paragraph(p, 24, bold=True)
+    p.space_after = _PT[20]
 
     items = [
         (
@@ -64,114 +188,86 @@ def create_overview_slide(prs):
         ),
     ]
 
-    for item_title, item_desc in items:
-        p = tf.add_paragraph()
-        p.text = f"• {item_title}"
-        p.font.size = Pt(20)
-        p.font.bold = True
-        p.level = 0
-        p.space_after = Pt(8)
-
-        p = tf.add_paragraph()
-        p.text = item_desc
-        p.font.size = Pt(16)
-        p.level = 1
-        p.space_after = Pt(16)
+    _add_bullets(
+        tf,
+        [(f"{_BULLET}{title}", desc) for title, desc in items],
+        head_size=20,
+        body_size=16,
+        head_space=8,
+        body_space=16,
+    )
 
 
-def create_rag_architecture_slide(prs):
+def create_rag_architecture_slide(prs, blank_layout):
     """Create RAG architecture diagram slide."""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank layout
-
-    # Title
-    title_box = slide.shapes.add_textbox(
-        Inches(0.5), Inches(0.3), Inches(9), Inches(0.6)
-    )
-    title_frame = title_box.text_frame
-    title_frame.text = "Agentic RAG Workflow Architecture"
-    title_frame.paragraphs[0].font.size = Pt(32)
-    title_frame.paragraphs[0].font.bold = True
-    title_frame.paragraphs[0].font.color.rgb = RGBColor(0, 102, 204)
-
-    # Node positions
-    node_y = Inches(2)
-    node_height = Inches(0.8)
-    node_width = Inches(1.8)
-    spacing = Inches(1.5)
+    slide = prs.slides.add_slide(blank_layout)
+    _add_title_box(slide, "Agentic RAG Workflow Architecture")
+
+    # Geometry as plain EMU ints; node i sits at left + i * spacing
+    left = int(Inches(0.8))
+    spacing = int(Inches(1.5))
+    node_y = int(Inches(2))
+    node_width = int(Inches(1.8))
+    node_height = int(Inches(0.8))
+    arrow_y = node_y + node_height // 2
+    desc_y = node_y + node_height + int(Inches(0.3))
+    desc_height = int(Inches(0.6))
 
     nodes = [
-        ("START", Inches(0.8), RGBColor(100, 200, 100)),
-        ("classify_mode", Inches(0.8) + spacing * 1, RGBColor(100, 150, 255)),
-        ("retrieve", Inches(0.8) + spacing * 2, RGBColor(100, 150, 255)),
-        ("generate", Inches(0.8) + spacing * 3, RGBColor(100, 150, 255)),
-        ("END", Inches(0.8) + spacing * 4, RGBColor(255, 100, 100)),
+        ("START", "Entry", _PAL["green"]),
+        ("classify_mode", "Classify query\ntype", _PAL["node"]),
+        ("retrieve", "Fetch docs\n(3 or 8)", _PAL["node"]),
+        ("generate", "Create\nresponse", _PAL["node"]),
+        ("END", "Exit", _PAL["stop"]),
     ]
 
-    # Draw nodes
-    prev_x = None
-    for node_name, x_pos, color in nodes:
-        # Create rounded rectangle
-        shape = slide.shapes.add_shape(
-            MSO_SHAPE.ROUNDED_RECTANGLE, x_pos, node_y, node_width, node_height
+    # Draw each node with its description below, noting where the arrow
+    # from the previous node goes
+    arrow_spans = []
+    for i, (node_name, desc_text, color) in enumerate(nodes):
+        x_pos = left + spacing * i
+        _add_node(
+            slide,
+            x_pos,
+            node_y,
+            node_width,
+            node_height,
+            color,
+            node_name,
+            14,
+            line_width=_PT[2],
         )
-        shape.fill.solid()
-        shape.fill.fore_color.rgb = color
-        shape.line.color.rgb = RGBColor(50, 50, 50)
-        shape.line.width = Pt(2)
-
-        # Add text
-        text_frame = shape.text_frame
-        text_frame.text = node_name
-        text_frame.paragraphs[0].font.size = Pt(14)
-        text_frame.paragraphs[0].font.bold = True
-        text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-        text_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
-
-        # Draw arrow from previous node
-        if prev_x is not None:
-            arrow_start_x = prev_x + node_width
-            arrow_end_x = x_pos
-            arrow_y = node_y + node_height / 2
-
-            connector = slide.shapes.add_connector(
-                1,  # Straight connector
-                arrow_start_x,
-                arrow_y,
-                arrow_end_x,
-                arrow_y,
-            )
-            connector.line.color.rgb = RGBColor(50, 50, 50)
-            connector.line.width = Pt(2)
-
-        prev_x = x_pos
-
-    # Add descriptions below nodes
-    descriptions = [
-        ("Entry", Inches(0.8)),
-        ("Classify query\ntype", Inches(0.8) + spacing * 1),
-        ("Fetch docs\n(3 or 8)", Inches(0.8) + spacing * 2),
-        ("Create\nresponse", Inches(0.8) + spacing * 3),
-        ("Exit", Inches(0.8) + spacing * 4),
-    ]
 
-    desc_y = node_y + node_height + Inches(0.3)
-    for desc_text, x_pos in descriptions:
-        desc_box = slide.shapes.add_textbox(x_pos, desc_y, node_width, Inches(0.6))
+        desc_box = slide.shapes.add_textbox(x_pos, desc_y, node_width, desc_height)
         desc_frame = desc_box.text_frame
         desc_frame.text = desc_text
-        desc_frame.paragraphs[0].font.size = Pt(11)
-        desc_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
+        _style_paragraph(desc_frame.paragraphs[0], 11, align=PP_ALIGN.CENTER)
+
+        if i > 0:
+            arrow_spans.append((x_pos - spacing + node_width, x_pos))
+
+    # Arrows between consecutive nodes, as a single group shape
+    arrows = slide.shapes.add_group_shape()
+    for start_x, end_x in arrow_spans:
+        connector = arrows.shapes.add_connector(
+            1,  # Straight connector
+            start_x,
+            arrow_y,
+            end_x,
+            arrow_y,
+        )
+        connector.line.color.rgb = _PAL["grey"]
+        connector.line.width = _PT[2]
 
 
-def create_rag_nodes_slide(prs):
+def create_rag_nodes_slide(prs, content_layout):
     """Create detailed RAG nodes explanation slide."""
-    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    slide = prs.slides.add_slide(content_layout)
     title = slide.shapes.title
     title.text = "RAG Workflow Nodes"
 
     content = slide.placeholders[1]
     tf = content.text_frame
-    tf.clear()
 
     nodes_info = [
         ("classify_mode", "Analyzes query to determine 'summary' or 'fact' mode"),
@@ -179,39 +275,31 @@ def create_rag_nodes_slide(prs):
         ("generate", "Creates grounded response using only retrieved context"),
     ]
 
-    for node_name, description in nodes_info:
-        # Node name
-        p = tf.paragraphs[0] if node_name == nodes_info[0][0] else tf.add_paragraph()
-        p.text = f"🔹 {node_name}"
-        p.font.size = Pt(20)
-        p.font.bold = True
-        p.font.color.rgb = RGBColor(0, 102, 204)
-        p.space_after = Pt(8)
-
-        # Description
-        p = tf.add_paragraph()
-        p.text = description
-        p.font.size = Pt(16)
-        p.level = 1
-        p.space_after = Pt(16)
+    _add_bullets(
+        tf,
+        [(f"{_DIAMOND}{name}", description) for name, description in nodes_info],
+        head_size=20,
+        body_size=16,
+        head_space=8,
+        body_space=16,
+        head_color=_PAL["blue"],
+    )
 
 
-def create_rag_state_slide(prs):
+def create_rag_state_slide(prs, content_layout):
     """Create RAG state management slide."""
-    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    slide = prs.slides.add_slide(content_layout)
     title = slide.shapes.title
     title.text = "RAG State Management"
 
     content = slide.placeholders[1]
     tf = content.text_frame
-    tf.clear()
 
     # Add heading
     p = tf.paragraphs[0]
     p.text = "RAGState (TypedDict):"
-    p.font.size = Pt(22)
-    p.font.bold = True
-    p.space_after = Pt(16)
+    _style_paragraph(p, 22, bold=True)
+    p.space_after = _PT[16]
 
     # State fields
     state_fields = [
@@ -221,32 +309,26 @@ def create_rag_state_slide(prs):
         ("generation: str", "Final response (output)"),
     ]
 
-    for field, description in state_fields:
-        p = tf.add_paragraph()
-        p.text = field
-        p.font.size = Pt(16)
-        p.font.bold = True
-        p.font.name = "Courier New"
-        p.font.color.rgb = RGBColor(204, 0, 0)
-        p.level = 0
-        p.space_after = Pt(4)
-
-        p = tf.add_paragraph()
-        p.text = f"→ {description}"
-        p.font.size = Pt(14)
-        p.level = 1
-        p.space_after = Pt(12)
+    _add_bullets(
+        tf,
+        [(field, f"{_ARROW}{description}") for field, description in state_fields],
+        head_size=16,
+        body_size=14,
+        head_space=4,
+        body_space=12,
+        head_color=_PAL["red"],
+        head_name="Courier New",
+    )
 
 
-def create_rag_features_slide(prs):
+def create_rag_features_slide(prs, content_layout):
     """Create RAG features slide."""
-    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    slide = prs.slides.add_slide(content_layout)
     title = slide.shapes.title
     title.text = "RAG Key Features"
 
     content = slide.placeholders[1]
     tf = content.text_frame
-    tf.clear()
 
     features = [
         ("Linear Workflow", "No conditional edges or loops - predictable flow"),
@@ -257,109 +339,75 @@ def create_rag_features_slide(prs):
         ("Vector Store Caching", "Faster reloads with FAISS cache (7-day TTL)"),
     ]
 
-    p = tf.paragraphs[0]
-    for i, (feature, description) in enumerate(features):
-        if i > 0:
-            p = tf.add_paragraph()
-        p.text = f"✓ {feature}"
-        p.font.size = Pt(18)
-        p.font.bold = True
-        p.space_after = Pt(6)
-
-        p = tf.add_paragraph()
-        p.text = description
-        p.font.size = Pt(14)
-        p.level = 1
-        p.space_after = Pt(12)
+    _add_bullets(
+        tf,
+        [(f"{_CHECK}{feature}", description) for feature, description in features],
+        head_size=18,
+        body_size=14,
+        head_space=6,
+        body_space=12,
+    )
 
 
-def create_react_architecture_slide(prs):
+def create_react_architecture_slide(prs, blank_layout):
     """Create ReAct agent architecture slide."""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank layout
-
-    # Title
-    title_box = slide.shapes.add_textbox(
-        Inches(0.5), Inches(0.3), Inches(9), Inches(0.6)
-    )
-    title_frame = title_box.text_frame
-    title_frame.text = "ReAct Agent Architecture (Cyclic)"
-    title_frame.paragraphs[0].font.size = Pt(32)
-    title_frame.paragraphs[0].font.bold = True
-    title_frame.paragraphs[0].font.color.rgb = RGBColor(0, 102, 204)
+    slide = prs.slides.add_slide(blank_layout)
+    _add_title_box(slide, "ReAct Agent Architecture (Cyclic)")
 
     # Create diagram with cycling capability
     center_x = Inches(5)
     center_y = Inches(3.5)
+    column_x = center_x - Inches(1)  # START, Agent and Tools share a column
 
     # START node
-    start_shape = slide.shapes.add_shape(
-        MSO_SHAPE.ROUNDED_RECTANGLE,
-        center_x - Inches(1),
+    _add_node(
+        slide,
+        column_x,
         Inches(1.5),
         Inches(2),
         Inches(0.7),
+        _PAL["green"],
+        "START",
+        16,
     )
-    start_shape.fill.solid()
-    start_shape.fill.fore_color.rgb = RGBColor(100, 200, 100)
-    start_shape.line.color.rgb = RGBColor(50, 50, 50)
-    start_shape.text_frame.text = "START"
-    start_shape.text_frame.paragraphs[0].font.size = Pt(16)
-    start_shape.text_frame.paragraphs[0].font.bold = True
-    start_shape.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-    start_shape.text_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
 
     # Agent Node
-    agent_shape = slide.shapes.add_shape(
-        MSO_SHAPE.ROUNDED_RECTANGLE,
-        center_x - Inches(1),
+    _add_node(
+        slide,
+        column_x,
         center_y - Inches(0.5),
         Inches(2),
         Inches(1),
+        _PAL["node"],
+        "Agent Node\n(LLM Reasoning)",
+        16,
+        line_width=_PT[2.5],
     )
-    agent_shape.fill.solid()
-    agent_shape.fill.fore_color.rgb = RGBColor(100, 150, 255)
-    agent_shape.line.color.rgb = RGBColor(50, 50, 50)
-    agent_shape.line.width = Pt(2.5)
-    agent_shape.text_frame.text = "Agent Node\n(LLM Reasoning)"
-    agent_shape.text_frame.paragraphs[0].font.size = Pt(16)
-    agent_shape.text_frame.paragraphs[0].font.bold = True
-    agent_shape.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-    agent_shape.text_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
 
     # Tools Node
-    tools_shape = slide.shapes.add_shape(
-        MSO_SHAPE.ROUNDED_RECTANGLE,
-        center_x - Inches(1),
+    _add_node(
+        slide,
+        column_x,
         center_y + Inches(1.5),
         Inches(2),
         Inches(1),
+        _PAL["tool"],
+        "Tools Node\n(Tavily Search)",
+        16,
+        line_width=_PT[2.5],
     )
-    tools_shape.fill.solid()
-    tools_shape.fill.fore_color.rgb = RGBColor(255, 180, 100)
-    tools_shape.line.color.rgb = RGBColor(50, 50, 50)
-    tools_shape.line.width = Pt(2.5)
-    tools_shape.text_frame.text = "Tools Node\n(Tavily Search)"
-    tools_shape.text_frame.paragraphs[0].font.size = Pt(16)
-    tools_shape.text_frame.paragraphs[0].font.bold = True
-    tools_shape.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-    tools_shape.text_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
 
     # END node
-    end_shape = slide.shapes.add_shape(
-        MSO_SHAPE.ROUNDED_RECTANGLE,
+    _add_node(
+        slide,
         center_x + Inches(2.5),
         center_y - Inches(0.35),
         Inches(1.5),
         Inches(0.7),
+        _PAL["stop"],
+        "END",
+        16,
     )
-    end_shape.fill.solid()
-    end_shape.fill.fore_color.rgb = RGBColor(255, 100, 100)
-    end_shape.line.color.rgb = RGBColor(50, 50, 50)
-    end_shape.text_frame.text = "END"
-    end_shape.text_frame.paragraphs[0].font.size = Pt(16)
-    end_shape.text_frame.paragraphs[0].font.bold = True
-    end_shape.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-    end_shape.text_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
 
     # Add text annotations
     annotations = [
@@ -373,20 +421,17 @@ def create_react_architecture_slide(prs):
         text_box = slide.shapes.add_textbox(x, y, Inches(1), Inches(0.3))
         text_frame = text_box.text_frame
         text_frame.text = text
-        text_frame.paragraphs[0].font.size = Pt(size)
-        text_frame.paragraphs[0].font.bold = True
-        text_frame.paragraphs[0].font.color.rgb = RGBColor(200, 0, 0)
+        _style_paragraph(text_frame.paragraphs[0], size, bold=True, color=_PAL["annot"])
 
 
-def create_react_features_slide(prs):
+def create_react_features_slide(prs, content_layout):
     """Create ReAct features slide."""
-    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    slide = prs.slides.add_slide(content_layout)
     title = slide.shapes.title
     title.text = "ReAct Agent Features"
 
     content = slide.placeholders[1]
     tf = content.text_frame
-    tf.clear()
 
     features = [
         ("Cyclic Workflow", "Can loop multiple times for complex queries"),
@@ -397,39 +442,35 @@ def create_react_features_slide(prs):
         ("Multi-Step Reasoning", "Can chain multiple searches together"),
     ]
 
-    p = tf.paragraphs[0]
-    for i, (feature, description) in enumerate(features):
-        if i > 0:
-            p = tf.add_paragraph()
-        p.text = f"✓ {feature}"
-        p.font.size = Pt(18)
-        p.font.bold = True
-        p.space_after = Pt(6)
-
-        p = tf.add_paragraph()
-        p.text = description
-        p.font.size = Pt(14)
-        p.level = 1
-        p.space_after = Pt(12)
+    _add_bullets(
+        tf,
+        [(f"{_CHECK}{feature}", description) for feature, description in features],
+        head_size=18,
+        body_size=14,
+        head_space=6,
+        body_space=12,
+    )
 
 
-def create_comparison_slide(prs):
+def create_comparison_slide(prs, blank_layout):
     """Create comparison table slide."""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank layout
+    slide = prs.slides.add_slide(blank_layout)
+    _add_title_box(slide, "RAG vs. ReAct Agent Comparison")
 
-    # Title
-    title_box = slide.shapes.add_textbox(
-        Inches(0.5), Inches(0.3), Inches(9), Inches(0.6)
-    )
-    title_frame = title_box.text_frame
-    title_frame.text = "RAG vs. ReAct Agent Comparison"
-    title_frame.paragraphs[0].font.size = Pt(32)
-    title_frame.paragraphs[0].font.bold = True
-    title_frame.paragraphs[0].font.color.rgb = RGBColor(0, 102, 204)
+    headers = ["Feature", "Agentic RAG", "ReAct Agent"]
+    data = [
+        ["Purpose", "Document QA", "Web search + Chat"],
+        ["Data Source", "Uploaded PDFs", "Real-time web (Tavily)"],
+        ["Graph Type", "Linear (fixed)", "Cyclic (loops)"],
+        ["Nodes", "3 agent nodes", "2 nodes (agent + tools)"],
+        ["Conditional Logic", "None", "Yes (tool decisions)"],
+        ["Response Mode", "Adaptive (2 modes)", "Single strategy"],
+        ["Streaming", "Not implemented", "Supported"],
+    ]
 
     # Create table
-    rows = 8
-    cols = 3
+    rows = len(data) + 1
+    cols = len(headers)
     left = Inches(0.5)
     top = Inches(1.5)
     width = Inches(9)
@@ -442,57 +483,40 @@ def create_comparison_slide(prs):
     table.columns[1].width = Inches(3.25)
     table.columns[2].width = Inches(3.25)
 
-    # Header row
-    headers = ["Feature", "Agentic RAG", "ReAct Agent"]
-    for i, header in enumerate(headers):
-        cell = table.cell(0, i)
-        cell.text = header
-        cell.text_frame.paragraphs[0].font.size = Pt(14)
-        cell.text_frame.paragraphs[0].font.bold = True
-        cell.fill.solid()
-        cell.fill.fore_color.rgb = RGBColor(0, 102, 204)
-        cell.text_frame.paragraphs[0].font.color.rgb = RGBColor(255, 255, 255)
-
-    # Data rows
-    data = [
-        ["Purpose", "Document QA", "Web search + Chat"],
-        ["Data Source", "Uploaded PDFs", "Real-time web (Tavily)"],
-        ["Graph Type", "Linear (fixed)", "Cyclic (loops)"],
-        ["Nodes", "3 agent nodes", "2 nodes (agent + tools)"],
-        ["Conditional Logic", "None", "Yes (tool decisions)"],
-        ["Response Mode", "Adaptive (2 modes)", "Single strategy"],
-        ["Streaming", "Not implemented", "Supported"],
-    ]
+    # Fill every cell in one pass: styling and background are decided once
+    # per row (header, alternate shaded row, or plain row)
+    header_style = {"bold": True, "color": _PAL["white"]}
+    for row_idx, row_data in enumerate([headers] + data):
+        if row_idx == 0:
+            size, style, fill = 14, header_style, _PAL["blue"]
+        elif row_idx % 2 == 0:
+            size, style, fill = 11, {}, _PAL["alt"]
+        else:
+            size, style, fill = 11, {}, None
 
-    for row_idx, row_data in enumerate(data, start=1):
         for col_idx, cell_text in enumerate(row_data):
             cell = table.cell(row_idx, col_idx)
             cell.text = cell_text
-            cell.text_frame.paragraphs[0].font.size = Pt(11)
-
-            # Alternate row colors
-            if row_idx % 2 == 0:
+            _style_paragraph(cell.text_frame.paragraphs[0], size, **style)
+            if fill is not None:
                 cell.fill.solid()
-                cell.fill.fore_color.rgb = RGBColor(240, 240, 240)
+                cell.fill.fore_color.rgb = fill
 
 
-def create_use_cases_slide(prs):
+def create_use_cases_slide(prs, content_layout):
     """Create use cases slide."""
-    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    slide = prs.slides.add_slide(content_layout)
     title = slide.shapes.title
     title.text = "When to Use Each Agent"
 
     content = slide.placeholders[1]
     tf = content.text_frame
-    tf.clear()
 
     # RAG use cases
     p = tf.paragraphs[0]
     p.text = "🟦 Agentic RAG - Use When:"
-    p.font.size = Pt(22)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(0, 102, 204)
-    p.space_after = Pt(10)
+    _style_paragraph(p, 22, bold=True, color=_PAL["blue"])
+    p.space_after = _PT[10]
 
     rag_cases = [
         "You have proprietary documents (PDFs, reports)",
@@ -503,19 +527,17 @@ def create_use_cases_slide(prs):
 
     for case in rag_cases:
         p = tf.add_paragraph()
-        p.text = f"• {case}"
-        p.font.size = Pt(14)
+        p.text = f"{_BULLET}{case}"
+        _style_paragraph(p, 14)
         p.level = 1
-        p.space_after = Pt(8)
+        p.space_after = _PT[8]
 
     # ReAct use cases
     p = tf.add_paragraph()
     p.text = "🟧 ReAct Agent - Use When:"
-    p.font.size = Pt(22)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(255, 140, 0)
-    p.space_after = Pt(10)
-    p.space_before = Pt(20)
+    _style_paragraph(p, 22, bold=True, color=_PAL["orange"])
+    p.space_after = _PT[10]
+    p.space_before = _PT[20]
 
     react_cases = [
         "Need current information (news, prices, events)",
@@ -526,21 +548,20 @@ def create_use_cases_slide(prs):
 
     for case in react_cases:
         p = tf.add_paragraph()
-        p.text = f"• {case}"
-        p.font.size = Pt(14)
+        p.text = f"{_BULLET}{case}"
+        _style_paragraph(p, 14)
         p.level = 1
-        p.space_after = Pt(8)
+        p.space_after = _PT[8]
 
 
-def create_code_example_slide(prs):
+def create_code_example_slide(prs, content_layout):
     """Create code example slide."""
-    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    slide = prs.slides.add_slide(content_layout)
     title = slide.shapes.title
     title.text = "Implementation Example"
 
     content = slide.placeholders[1]
     tf = content.text_frame
-    tf.clear()
 
     # Code example
     code = """# RAG Workflow Setup
@@ -569,20 +590,18 @@ response = await AgentChatbotHelper.process_agent_response(
 
     p = tf.paragraphs[0]
     p.text = code
-    p.font.size = Pt(12)
-    p.font.name = "Courier New"
-    p.space_after = Pt(10)
+    _style_paragraph(p, 12, name="Courier New")
+    p.space_after = _PT[10]
 
 
-def create_file_references_slide(prs):
+def create_file_references_slide(prs, content_layout):
     """Create file references slide."""
-    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    slide = prs.slides.add_slide(content_layout)
     title = slide.shapes.title
     title.text = "Implementation File References"
 
     content = slide.placeholders[1]
     tf = content.text_frame
-    tf.clear()
 
     references = [
         (
@@ -611,30 +630,26 @@ def create_file_references_slide(prs):
         if i > 0:
             p = tf.add_paragraph()
         p.text = section
-        p.font.size = Pt(18)
-        p.font.bold = True
-        p.font.color.rgb = RGBColor(0, 102, 204)
-        p.space_after = Pt(8)
-        p.space_before = Pt(12) if i > 0 else Pt(0)
+        _style_paragraph(p, 18, bold=True, color=_PAL["blue"])
+        p.space_after = _PT[8]
+        p.space_before = _PT[12] if i > 0 else _PT[0]
 
         for item in items:
             p = tf.add_paragraph()
-            p.text = f"• {item}"
-            p.font.size = Pt(13)
-            p.font.name = "Courier New"
+            p.text = f"{_BULLET}{item}"
+            _style_paragraph(p, 13, name="Courier New")
             p.level = 1
-            p.space_after = Pt(6)
+            p.space_after = _PT[6]
 
 
-def create_summary_slide(prs):
+def create_summary_slide(prs, content_layout):
     """Create summary slide."""
-    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    slide = prs.slides.add_slide(content_layout)
     title = slide.shapes.title
     title.text = "Key Takeaways"
 
     content = slide.placeholders[1]
     tf = content.text_frame
-    tf.clear()
 
     takeaways = [
         "Both agents use typed state management for reliability",
@@ -649,20 +664,19 @@ def create_summary_slide(prs):
     for i, takeaway in enumerate(takeaways):
         if i > 0:
             p = tf.add_paragraph()
-        p.text = f"✓ {takeaway}"
-        p.font.size = Pt(18)
-        p.space_after = Pt(14)
+        p.text = f"{_CHECK}{takeaway}"
+        _style_paragraph(p, 18)
+        p.space_after = _PT[14]
 
 
-def create_next_steps_slide(prs):
+def create_next_steps_slide(prs, content_layout):
     """Create next steps slide."""
-    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    slide = prs.slides.add_slide(content_layout)
     title = slide.shapes.title
     title.text = "Next Steps"
 
     content = slide.placeholders[1]
     tf = content.text_frame
-    tf.clear()
 
     steps = [
         ("Try the Agents", "Run: streamlit run Home.py"),
@@ -673,24 +687,44 @@ def create_next_steps_slide(prs):
         ("Read Docs", "Check CLAUDE.md for full architecture"),
     ]
 
-    p = tf.paragraphs[0]
-    for i, (step, description) in enumerate(steps):
-        if i > 0:
-            p = tf.add_paragraph()
-        p.text = f"{i + 1}. {step}"
-        p.font.size = Pt(18)
-        p.font.bold = True
-        p.space_after = Pt(6)
+    _add_bullets(
+        tf,
+        [
+            (f"{i}. {step}", description)
+            for i, (step, description) in enumerate(steps, 1)
+        ],
+        head_size=18,
+        body_size=15,
+        head_space=6,
+        body_space=12,
+    )
 
-        p = tf.add_paragraph()
-        p.text = description
-        p.font.size = Pt(15)
-        p.level = 1
-        p.space_after = Pt(12)
 
+def _is_up_to_date(output_file):
+    """Return True if output_file exists and is newer than this script."""
+    try:
+        return os.path.getmtime(output_file) >= os.path.getmtime(__file__)
+    except OSError:
+        return False
 
-def main():
+
+def main(argv=None):
     """Generate the PowerPoint presentation."""
+    parser = argparse.ArgumentParser(
+        description="Generate the LangGraph agents PowerPoint presentation."
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="rebuild even if the output is newer than this script",
+    )
+    args = parser.parse_args(argv)
+
+    output_file = OUTPUT_FILE
+    if not args.force and _is_up_to_date(output_file):
+        print(f"✅ {output_file} is up to date (use --force to rebuild)")
+        return
+
     print("🎨 Generating LangGraph Agents PowerPoint Presentation...")
 
     # Create presentation
@@ -698,59 +732,48 @@ def main():
     prs.slide_width = Inches(10)
     prs.slide_height = Inches(7.5)
 
-    # Create slides
-    print("  📄 Creating title slide...")
-    create_title_slide(prs)
-
-    print("  📄 Creating overview slide...")
-    create_overview_slide(prs)
-
-    print("  📄 Creating RAG architecture diagram...")
-    create_rag_architecture_slide(prs)
-
-    print("  📄 Creating RAG nodes explanation...")
-    create_rag_nodes_slide(prs)
-
-    print("  📄 Creating RAG state management slide...")
-    create_rag_state_slide(prs)
-
-    print("  📄 Creating RAG features slide...")
-    create_rag_features_slide(prs)
-
-    print("  📄 Creating ReAct architecture diagram...")
-    create_react_architecture_slide(prs)
-
-    print("  📄 Creating ReAct features slide...")
-    create_react_features_slide(prs)
-
-    print("  📄 Creating comparison table...")
-    create_comparison_slide(prs)
-
-    print("  📄 Creating use cases slide...")
-    create_use_cases_slide(prs)
-
-    print("  📄 Creating code example slide...")
-    create_code_example_slide(prs)
-
-    print("  📄 Creating file references slide...")
-    create_file_references_slide(prs)
-
-    print("  📄 Creating summary slide...")
-    create_summary_slide(prs)
-
-    print("  📄 Creating next steps slide...")
-    create_next_steps_slide(prs)
-
-    # Save presentation
-    output_file = "langgraph_agents_presentation.pptx"
-    prs.save(output_file)
-
-    print("\n✅ Presentation created successfully!")
-    print(f"📁 Output file: {output_file}")
-    print(f"📊 Total slides: {len(prs.slides)}")
-    print(
-        "\nTo view the presentation, open it in Microsoft PowerPoint or compatible software."
-    )
+    # Resolve the layouts once instead of indexing slide_layouts per slide
+    title_layout = prs.slide_layouts[0]
+    content_layout = prs.slide_layouts[1]
+    blank_layout = prs.slide_layouts[6]
+
+    # Create slides; progress lines are collected and written once below
+    slides = [
+        ("title slide", create_title_slide, title_layout),
+        ("overview slide", create_overview_slide, content_layout),
+        ("RAG architecture diagram", create_rag_architecture_slide, blank_layout),
+        ("RAG nodes explanation", create_rag_nodes_slide, content_layout),
+        ("RAG state management slide", create_rag_state_slide, content_layout),
+        ("RAG features slide", create_rag_features_slide, content_layout),
+        ("ReAct architecture diagram", create_react_architecture_slide, blank_layout),
+        ("ReAct features slide", create_react_features_slide, content_layout),
+        ("comparison table", create_comparison_slide, blank_layout),
+        ("use cases slide", create_use_cases_slide, content_layout),
+        ("code example slide", create_code_example_slide, content_layout),
+        ("file references slide", create_file_references_slide, content_layout),
+        ("summary slide", create_summary_slide, content_layout),
+        ("next steps slide", create_next_steps_slide, content_layout),
+    ]
+    status = []
+    for label, build_slide, layout in slides:
+        status.append(f"  📄 Creating {label}...")
+        build_slide(prs, layout)
+
+    # Save presentation: serialize in memory, then write the file in one go
+    buffer = BytesIO()
+    prs.save(buffer)
+    with open(output_file, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(buffer.getbuffer())
+
+    status += [
+        "",
+        "✅ Presentation created successfully!",
+        f"📁 Output file: {output_file}",
+        f"📊 Total slides: {len(prs.slides)}",
+        "",
+        "To view the presentation, open it in Microsoft PowerPoint or compatible software.",
+    ]
+    sys.stdout.write("\n".join(status) + "\n")
 
 
 if __name__ == "__main__":
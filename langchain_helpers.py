@@ -10,13 +10,27 @@ Provides helper classes for different types of chatbot functionality:
 - ValidationHelper: Input validation utilities
 """
 
+import asyncio
 import os
 import hashlib
+import importlib.util
 import json
+import pickle
+import re
 import shutil
+import sqlite3
+import threading
+import time
+import faiss
+import numpy as np
+import tiktoken
+from collections import Counter
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, TypedDict, Literal, Tuple, Optional
+from typing import List, Dict, Any, AsyncIterator, TypedDict, Literal, Tuple, Optional
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.documents import Document
@@ -26,6 +40,33 @@ from langchain_community.vectorstores import FAISS
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langgraph.graph import StateGraph, END
 
+from config import Config
+
+# orjson ships with langsmith; fall back to compact stdlib JSON without it
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _json_loads = json.loads
+
+
+def _normalize_question(question: str) -> str:
+    """Normalize a question for exact-match answer caching.
+
+    Only case, whitespace and trailing punctuation are ignored; any other
+    difference (a name, a number, a date) makes it a different question.
+
+    Args:
+        question: User's question
+
+    Returns:
+        Normalized question text
+    """
+    return " ".join(question.lower().split()).rstrip("?!. ")
+
 
 class BasicChatbotHelper:
     """Helper class for basic conversational chatbot functionality.
@@ -133,6 +174,11 @@ class AgentChatbotHelper:
     to search and retrieve current information from the web.
     """
 
+    # Response cache: reuse answers to repeated questions. Web results go
+    # stale, so entries expire.
+    RESPONSE_CACHE_TTL_SECONDS = 60 * 60
+    RESPONSE_CACHE_MAX_ENTRIES = 200
+
     @staticmethod
     def setup_agent(openai_api_key: str, tavily_api_key: str) -> Any:
         """Setup an AI agent with Tavily web search capabilities.
@@ -163,14 +209,120 @@ class AgentChatbotHelper:
         agent = create_react_agent(llm, tools)
         return agent
 
+    @staticmethod
+    def find_cached_response(
+        cache: Dict[str, Tuple[str, float]], query: str
+    ) -> Optional[str]:
+        """Find a cached response to the same question asked earlier.
+
+        Questions match after normalization only, so e.g. the same question
+        about another city or year is never answered from the cache.
+
+        Args:
+            cache: Dict of normalized question to (response, time cached)
+            query: User's question
+
+        Returns:
+            The cached response if one is younger than
+            RESPONSE_CACHE_TTL_SECONDS, None otherwise
+        """
+        entry = cache.get(_normalize_question(query))
+        if (
+            entry is not None
+            and time.time() - entry[1] < AgentChatbotHelper.RESPONSE_CACHE_TTL_SECONDS
+        ):
+            return entry[0]
+        return None
+
+    @staticmethod
+    def add_cached_response(
+        cache: Dict[str, Tuple[str, float]], query: str, response: str
+    ) -> None:
+        """Store a response in the cache, evicting the oldest entries.
+
+        Args:
+            cache: Dict of normalized question to (response, time cached)
+            query: Answered question
+            response: Agent response to cache
+        """
+        key = _normalize_question(query)
+        cache.pop(key, None)
+        cache[key] = (response, time.time())
+        while len(cache) > AgentChatbotHelper.RESPONSE_CACHE_MAX_ENTRIES:
+            del cache[next(iter(cache))]
+
+    @staticmethod
+    def _message_text(content: Any) -> str:
+        """Extract plain text from message content.
+
+        Args:
+            content: Message content, either a string or a list of content blocks
+
+        Returns:
+            The text portion of the content
+        """
+        if isinstance(content, list):
+            return "".join(
+                block.get("text", "")
+                for block in content
+                if isinstance(block, dict) and block.get("type") == "text"
+            )
+        return content or ""
+
+    @staticmethod
+    async def stream_agent_response(
+        agent: Any, user_query: str, timeout: int = 90
+    ) -> AsyncIterator[str]:
+        """Stream the agent's response token by token.
+
+        Yields model output as it is generated instead of waiting for the
+        full reasoning and tool-use trace to finish.
+
+        Args:
+            agent: The configured LangGraph agent
+            user_query: User's question or request
+            timeout: Maximum time in seconds for the whole response (default: 90)
+
+        Yields:
+            Text deltas of the agent's response
+
+        Raises:
+            asyncio.TimeoutError: If the response takes longer than timeout seconds
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        events = agent.astream_events({"messages": user_query}, version="v2")
+
+        try:
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        anext(events), timeout=max(deadline - loop.time(), 0)
+                    )
+                except StopAsyncIteration:
+                    return
+                except asyncio.TimeoutError:
+                    raise asyncio.TimeoutError(
+                        f"Agent response timed out after {timeout} seconds. The web search may be taking too long or the API may be unavailable."
+                    )
+
+                if event["event"] == "on_chat_model_stream":
+                    text = AgentChatbotHelper._message_text(
+                        event["data"]["chunk"].content
+                    )
+                    if text:
+                        yield text
+        finally:
+            await events.aclose()
+
     @staticmethod
     async def process_agent_response(
         agent: Any, user_query: str, timeout: int = 90
     ) -> str:
         """Process agent response with streaming support and timeout.
 
-        Handles the agent's reasoning and tool usage steps, collecting
-        all output into a cohesive response.
+        Collects the streamed reasoning and tool usage output into a
+        cohesive response.
 
         Args:
             agent: The configured LangGraph agent
@@ -183,48 +335,45 @@ class AgentChatbotHelper:
         Raises:
             asyncio.TimeoutError: If the response takes longer than timeout seconds
         """
-        import asyncio
-
-        async def _process():
-            accumulated_response = ""
-
-            # Stream state updates (includes reasoning and tool execution steps)
-            for update in agent.stream({"messages": user_query}):
-                messages = update.get("messages", [])
-                for message in messages:
-                    content = getattr(message, "content", "")
-
-                    # Handle structured content (list of content blocks)
-                    if not content and isinstance(
-                        getattr(message, "content", None), list
-                    ):
-                        content = "".join(
-                            block.get("text", "")
-                            for block in message.content
-                            if isinstance(block, dict) and block.get("type") == "text"
-                        )
-
-                    if content:
-                        accumulated_response += content
-
-            # Fallback to direct invocation if streaming failed
-            if not accumulated_response:
-                response = agent.invoke({"messages": user_query})
-                accumulated_response = (
-                    response["messages"][-1].content
-                    if isinstance(response, dict) and response.get("messages")
-                    else str(response)
-                )
+        chunks = [
+            chunk
+            async for chunk in AgentChatbotHelper.stream_agent_response(
+                agent, user_query, timeout
+            )
+        ]
+        if chunks:
+            return "".join(chunks)
+
+        # Fallback to direct invocation if streaming produced no text
+        return await AgentChatbotHelper.invoke_agent_response(
+            agent, user_query, timeout
+        )
 
-            return accumulated_response
+    @staticmethod
+    async def invoke_agent_response(
+        agent: Any, user_query: str, timeout: int = 90
+    ) -> str:
+        """Get the agent's final response without streaming.
 
-        # Apply timeout to the entire process
-        try:
-            return await asyncio.wait_for(_process(), timeout=timeout)
-        except asyncio.TimeoutError:
-            raise asyncio.TimeoutError(
-                f"Agent response timed out after {timeout} seconds. The web search may be taking too long or the API may be unavailable."
-            )
+        Args:
+            agent: The configured LangGraph agent
+            user_query: User's question or request
+            timeout: Maximum time in seconds to wait for response (default: 90)
+
+        Returns:
+            Text of the agent's final message
+
+        Raises:
+            asyncio.TimeoutError: If the response takes longer than timeout seconds
+        """
+        response = await asyncio.wait_for(
+            agent.ainvoke({"messages": user_query}), timeout=timeout
+        )
+        return (
+            AgentChatbotHelper._message_text(response["messages"][-1].content)
+            if isinstance(response, dict) and response.get("messages")
+            else str(response)
+        )
 
 
 class RAGHelper:
@@ -239,40 +388,149 @@ class RAGHelper:
         question: str
         mode: Literal["summary", "fact"]
         documents: List[Document]
+        context: str
         generation: str
 
     # Cache configuration
     CACHE_DIR = Path("tmp/vectorstores")
     MAX_CACHE_AGE_DAYS = 7
     MAX_CACHE_SIZE_MB = 500
+    STATS_TTL_SECONDS = 60
+    _stats_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+    _cache_write_lock = threading.Lock()
+
+    # Embedding backend: "openai" (default) or "local" (sentence-transformers)
+    EMBEDDING_BACKEND = Config.get_setting(
+        "EMBED_BACKEND", "openai", choices=("openai", "local")
+    )
+    LOCAL_EMBEDDING_MODEL = Config.get_setting(
+        "LOCAL_EMBED_MODEL", "BAAI/bge-small-en-v1.5"
+    )
+    _local_embeddings = None
+
+    # Embedding request fan-out
+    EMBED_BATCH_SIZE = 512
+    EMBED_CONCURRENCY = 8
+
+    # Approximate search settings (flat exact search below the threshold)
+    HNSW_MIN_VECTORS = 2000
+    HNSW_M = 32
+    HNSW_EF_CONSTRUCTION = 200
+    HNSW_EF_SEARCH = 64
+
+    # Product quantization settings for opt-in compressed indexes
+    # (PQ codebooks need ~39 training points per centroid: 39 * 2**PQ_BITS)
+    PQ_MIN_VECTORS = 10000
+    PQ_SUBQUANTIZERS = 64
+    PQ_BITS = 8
+    PQ_NPROBE = 16
+
+    # Memory-map cached indexes so pages load on demand instead of up front
+    INDEX_READ_FLAGS = faiss.IO_FLAG_MMAP_IFC | faiss.IO_FLAG_READ_ONLY
+
+    # Classification hints: determine if query needs summary or specific facts
+    SUMMARY_HINTS = (
+        "summarize",
+        "summary",
+        "overview",
+        "key points",
+        "bullet",
+        "synthesize",
+    )
+    FACT_HINTS = (
+        "when",
+        "date",
+        "who",
+        "where",
+        "amount",
+        "total",
+        "price",
+        "figure",
+        "specific",
+        "exact",
+    )
+
+    # Match all hints of a kind in a single scan of the query
+    _SUMMARY_PATTERN = re.compile("|".join(map(re.escape, SUMMARY_HINTS)))
+    _FACT_PATTERN = re.compile("|".join(map(re.escape, FACT_HINTS)))
+
+    # Generation model and token budget for the retrieved context
+    GENERATION_MODEL = "gpt-4o-mini"
+    CONTEXT_TOKEN_BUDGET = 4000
+    _encoding = None
+
+    # Cap on concurrent generation calls across all sessions in the process
+    LLM_MAX_CONCURRENCY = Config.get_int_setting("OPENAI_MAX_CONC", 8)
+    LLM_MAX_RETRIES = 6
+    _llm_slots = threading.BoundedSemaphore(LLM_MAX_CONCURRENCY)
+
+    # Answers reused for repeated questions about the same documents
+    ANSWER_CACHE_TTL_SECONDS = 60 * 60
+    ANSWER_CACHE_MAX_ENTRIES = 200
+
+    # Generation prompts per response mode
+    _GEN_PROMPTS = {
+        "summary": ChatPromptTemplate.from_messages(
+            [
+                (
+                    "system",
+                    "You are a helpful assistant. Create a concise, faithful summary ONLY using the provided context. "
+                    "Prefer bullet points if helpful. Do not use outside knowledge.",
+                ),
+                (
+                    "human",
+                    "Question:\n{question}\n\n"
+                    "Context (multiple document chunks):\n{context}\n\n"
+                    "Write a grounded summary:",
+                ),
+            ]
+        ),
+        "fact": ChatPromptTemplate.from_messages(
+            [
+                (
+                    "system",
+                    "You are a helpful assistant. Answer precisely and ONLY using the provided context. "
+                    "If the context is insufficient, say so.",
+                ),
+                ("human", "Question:\n{question}\n\nContext:\n{context}\n\nAnswer:"),
+            ]
+        ),
+    }
 
     @staticmethod
-    def _generate_cache_key(files, anonymize_pii: bool, pii_method: str) -> str:
+    def _generate_cache_key(
+        files, anonymize_pii: bool, pii_method: str, quantize: bool = False
+    ) -> str:
         """Generate unique cache key based on files and PII settings.
 
         Args:
             files: List of uploaded files
             anonymize_pii: Whether PII anonymization is enabled
             pii_method: PII anonymization method used
+            quantize: Whether the index is product-quantized
 
         Returns:
-            MD5 hash string as cache key
+            BLAKE2b hash string as cache key
         """
-        hasher = hashlib.md5()
+        hasher = hashlib.blake2b(digest_size=8)
 
-        # Hash file information (name + size for quick check)
-        # Note: Not hashing full content for performance
-        file_info = []
+        # Hash file name, size and content so same-size edits don't collide
         for file in sorted(files, key=lambda f: f.name):
-            file_info.append((file.name, file.size))
-
-        hasher.update(str(file_info).encode())
+            hasher.update(f"{file.name}\0{file.size}\0".encode())
+            file.seek(0)
+            for chunk in iter(lambda: file.read(1 << 20), b""):
+                hasher.update(chunk)
+            file.seek(0)
 
         # Hash PII settings
         settings_str = f"{anonymize_pii}_{pii_method}"
+        if quantize:
+            settings_str += "_pq"
+        if RAGHelper.EMBEDDING_BACKEND == "local":
+            settings_str += f"_{RAGHelper.LOCAL_EMBEDDING_MODEL}"
         hasher.update(settings_str.encode())
 
-        return hasher.hexdigest()[:16]
+        return hasher.hexdigest()
 
     @staticmethod
     def _get_cache_path(cache_key: str) -> Path:
@@ -288,6 +546,86 @@ class RAGHelper:
         cache_path.mkdir(parents=True, exist_ok=True)
         return cache_path
 
+    @staticmethod
+    def _get_embeddings(api_key: Optional[str], shared: bool = True) -> Any:
+        """Get the embeddings client for the configured backend.
+
+        The local backend runs a sentence-transformers model in-process
+        (requires the sentence-transformers package) and is created once.
+        The OpenAI client for the deployment's own key (from Docker secrets
+        or the environment) is shared process-wide so its HTTP connections are
+        reused across document sets and queries. Keys typed in by users are
+        never held process-wide: each call gets a client of its own, which
+        lives only as long as the session's vector stores.
+
+        Args:
+            api_key: OpenAI API key, used by the OpenAI backend only
+            shared: Whether to return the shared OpenAI client, when the key
+                is the deployment's own, rather than a new one (default: True)
+
+        Returns:
+            LangChain embeddings instance
+
+        Raises:
+            ImportError: If the local backend is selected but
+                sentence-transformers is not installed
+        """
+        if RAGHelper.EMBEDDING_BACKEND == "local":
+            if RAGHelper._local_embeddings is None:
+                if importlib.util.find_spec("sentence_transformers") is None:
+                    raise ImportError(
+                        "EMBED_BACKEND=local requires sentence-transformers. "
+                        "Install with: pip install sentence-transformers, "
+                        "or unset EMBED_BACKEND to use OpenAI embeddings"
+                    )
+
+                from langchain_community.embeddings import HuggingFaceEmbeddings
+
+                RAGHelper._local_embeddings = HuggingFaceEmbeddings(
+                    model_name=RAGHelper.LOCAL_EMBEDDING_MODEL,
+                    encode_kwargs={"normalize_embeddings": True},
+                )
+            return RAGHelper._local_embeddings
+
+        if shared and api_key == Config.get_api_key(
+            "OPENAI_API_KEY", allow_user_input=False
+        ):
+            return RAGHelper._shared_openai_embeddings(api_key)
+
+        embeddings_kwargs = {}
+        if api_key:
+            embeddings_kwargs["api_key"] = api_key
+
+        return OpenAIEmbeddings(**embeddings_kwargs)
+
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _shared_openai_embeddings(api_key: Optional[str]) -> OpenAIEmbeddings:
+        """Create the shared OpenAI embeddings client for a configured key.
+
+        Only called with the deployment's own key, never with user input.
+
+        Args:
+            api_key: OpenAI API key from Docker secrets or the environment
+
+        Returns:
+            OpenAIEmbeddings instance reused for this key
+        """
+        return RAGHelper._get_embeddings(api_key, shared=False)
+
+    @staticmethod
+    def _open_secure(path: Path):
+        """Open a file for binary writing, creating it readable by the owner only.
+
+        Args:
+            path: File to create or truncate
+
+        Returns:
+            Writable binary file object
+        """
+        fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        return os.fdopen(fd, "wb")
+
     @staticmethod
     def _save_to_cache(
         vector_store: FAISS,
@@ -305,45 +643,48 @@ class RAGHelper:
             files: List of uploaded files
             settings: PII settings used
         """
-        cache_path = RAGHelper._get_cache_path(cache_key)
-
-        try:
-            # Save FAISS vector store
-            vector_store.save_local(str(cache_path))
+        # Held while writing, so clear_all_caches() can't move the cache
+        # directory out from under a half-written entry
+        with RAGHelper._cache_write_lock:
+            cache_path = RAGHelper._get_cache_path(cache_key)
 
-            # Save PII entities
-            pii_file = cache_path / "pii_entities.json"
-            with open(pii_file, "w") as f:
-                json.dump(pii_entities, f, indent=2)
-
-            # Save metadata
-            metadata = {
-                "cache_key": cache_key,
-                "created_at": datetime.now().isoformat(),
-                "files": [{"name": f.name, "size": f.size} for f in files],
-                "file_count": len(files),
-                "settings": settings,
-                "pii_entity_count": len(pii_entities),
-                "vector_count": vector_store.index.ntotal,
-                "dimension": vector_store.index.d,
-            }
+            try:
+                # Save FAISS vector store
+                vector_store.save_local(str(cache_path))
+
+                # Save PII entities
+                pii_file = cache_path / "pii_entities.json"
+                with RAGHelper._open_secure(pii_file) as f:
+                    f.write(_json_dumps(pii_entities))
+
+                # Save metadata
+                metadata = {
+                    "cache_key": cache_key,
+                    "created_at": datetime.now().isoformat(),
+                    "files": [{"name": f.name, "size": f.size} for f in files],
+                    "file_count": len(files),
+                    "settings": settings,
+                    "pii_entity_count": len(pii_entities),
+                    "vector_count": vector_store.index.ntotal,
+                    "dimension": vector_store.index.d,
+                }
 
-            metadata_file = cache_path / "metadata.json"
-            with open(metadata_file, "w") as f:
-                json.dump(metadata, f, indent=2)
+                metadata_file = cache_path / "metadata.json"
+                with RAGHelper._open_secure(metadata_file) as f:
+                    f.write(json.dumps(metadata, indent=2).encode())
 
-            # Set restrictive permissions (owner only)
-            try:
-                for item in cache_path.rglob("*"):
-                    if item.is_file():
-                        os.chmod(item, 0o600)
-            except Exception:
-                pass  # Permission setting may fail on Windows
+                # Set restrictive permissions (owner only) on the FAISS files
+                try:
+                    os.chmod(cache_path / "index.faiss", 0o600)
+                    os.chmod(cache_path / "index.pkl", 0o600)
+                except OSError:
+                    pass  # Permission setting may fail on Windows
 
-            print(f"💾 Cached vector store: {cache_key}")
+                RAGHelper._stats_cache = None
+                print(f"💾 Cached vector store: {cache_key}")
 
-        except Exception as e:
-            print(f"⚠️ Failed to save cache: {e}")
+            except Exception as e:
+                print(f"⚠️ Failed to save cache: {e}")
 
     @staticmethod
     def _load_from_cache(
@@ -378,21 +719,21 @@ class RAGHelper:
                         return None
 
             # Load vector store
-            embeddings_kwargs = {}
-            if api_key:
-                embeddings_kwargs["api_key"] = api_key
-
-            embeddings = OpenAIEmbeddings(**embeddings_kwargs)
-            vector_store = FAISS.load_local(
-                str(cache_path), embeddings, allow_dangerous_deserialization=True
-            )
+            embeddings = RAGHelper._get_embeddings(api_key)
+            index = faiss.read_index(str(index_file), RAGHelper.INDEX_READ_FLAGS)
+            if isinstance(index, faiss.IndexHNSW):
+                # efSearch is a runtime setting that isn't written to disk
+                index.hnsw.efSearch = RAGHelper.HNSW_EF_SEARCH
+            with open(cache_path / "index.pkl", "rb") as f:
+                docstore, index_to_docstore_id = pickle.load(f)
+            vector_store = FAISS(embeddings, index, docstore, index_to_docstore_id)
 
             # Load PII entities
             pii_file = cache_path / "pii_entities.json"
             pii_entities = []
             if pii_file.exists():
-                with open(pii_file) as f:
-                    pii_entities = json.load(f)
+                with open(pii_file, "rb") as f:
+                    pii_entities = _json_loads(f.read())
 
             print(f"✅ Loaded from cache: {cache_key}")
             return vector_store, pii_entities
@@ -401,40 +742,162 @@ class RAGHelper:
             print(f"⚠️ Failed to load cache: {e}")
             return None
 
+    @staticmethod
+    def _dir_size(path: str) -> int:
+        """Total size in bytes of the files under a directory.
+
+        Args:
+            path: Directory to measure
+
+        Returns:
+            Combined size of all regular files, recursively
+        """
+        total = 0
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+                elif entry.is_dir(follow_symlinks=False):
+                    total += RAGHelper._dir_size(entry.path)
+        return total
+
+    @staticmethod
+    def _read_cache_entry(cache_dir: str) -> Tuple[str, Optional[Dict], int]:
+        """Read a cache directory's metadata and total size.
+
+        Args:
+            cache_dir: Path of a single cache directory
+
+        Returns:
+            Tuple of (cache_dir, metadata or None if unreadable, size in bytes)
+        """
+        metadata = None
+        try:
+            with open(os.path.join(cache_dir, "metadata.json")) as f:
+                metadata = json.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"⚠️ Error reading cache {os.path.basename(cache_dir)}: {e}")
+
+        return cache_dir, metadata, RAGHelper._dir_size(cache_dir)
+
+    @staticmethod
+    def _scan_caches() -> List[Tuple[str, Optional[Dict], int]]:
+        """Read metadata and sizes of all cache directories concurrently.
+
+        Returns:
+            One (cache_dir, metadata, size) tuple per cache directory
+        """
+        with os.scandir(RAGHelper.CACHE_DIR) as entries:
+            cache_dirs = [
+                entry.path for entry in entries if entry.is_dir(follow_symlinks=False)
+            ]
+
+        if not cache_dirs:
+            return []
+
+        # Reads are I/O-bound, so threads let slow directories overlap
+        with ThreadPoolExecutor(max_workers=min(8, len(cache_dirs))) as executor:
+            return list(executor.map(RAGHelper._read_cache_entry, cache_dirs))
+
+    @staticmethod
+    def _summarize_caches(
+        cache_entries: List[Tuple[str, Optional[Dict], int]],
+    ) -> Dict[str, Any]:
+        """Build cache statistics from scanned entries and remember them.
+
+        Args:
+            cache_entries: Output of _scan_caches (minus any removed caches)
+
+        Returns:
+            Dictionary with cache statistics
+        """
+        caches = []
+        total_size = 0
+
+        for _, metadata, cache_size in cache_entries:
+            total_size += cache_size
+            if metadata is not None:
+                metadata["size_mb"] = cache_size / (1024 * 1024)
+                caches.append(metadata)
+
+        caches.sort(key=lambda x: x["created_at"])
+
+        stats = {
+            "total_caches": len(caches),
+            "total_size_mb": total_size / (1024 * 1024),
+            "oldest_cache": caches[0] if caches else None,
+            "newest_cache": caches[-1] if caches else None,
+            "caches": caches,
+        }
+        RAGHelper._stats_cache = (time.monotonic(), stats)
+        return stats
+
     @staticmethod
     def cleanup_old_caches():
-        """Remove caches older than MAX_CACHE_AGE_DAYS."""
+        """Remove caches older than MAX_CACHE_AGE_DAYS.
+
+        The same scan also refreshes the cached result of get_cache_statistics.
+        """
         if not RAGHelper.CACHE_DIR.exists():
             return
 
         cutoff = datetime.now() - timedelta(days=RAGHelper.MAX_CACHE_AGE_DAYS)
         removed_count = 0
+        remaining = []
 
-        for cache_dir in RAGHelper.CACHE_DIR.iterdir():
-            if not cache_dir.is_dir():
-                continue
-
-            metadata_file = cache_dir / "metadata.json"
-            if metadata_file.exists():
-                try:
-                    with open(metadata_file) as f:
-                        metadata = json.load(f)
-                        created = datetime.fromisoformat(metadata["created_at"])
+        for cache_entry in RAGHelper._scan_caches():
+            cache_dir, metadata, _ = cache_entry
+            name = os.path.basename(cache_dir)
+            try:
+                if metadata is not None:
+                    created = datetime.fromisoformat(metadata["created_at"])
+                    if created < cutoff:
+                        shutil.rmtree(cache_dir)
+                        removed_count += 1
+                        print(f"🗑️ Removed old cache: {name}")
+                        continue
+            except Exception as e:
+                print(f"⚠️ Error cleaning cache {name}: {e}")
+            remaining.append(cache_entry)
 
-                        if created < cutoff:
-                            shutil.rmtree(cache_dir)
-                            removed_count += 1
-                            print(f"🗑️ Removed old cache: {cache_dir.name}")
-                except Exception as e:
-                    print(f"⚠️ Error cleaning cache {cache_dir.name}: {e}")
+        RAGHelper._summarize_caches(remaining)
 
         if removed_count > 0:
             print(f"Cleaned up {removed_count} old cache(s)")
 
+    @staticmethod
+    def clear_all_caches() -> None:
+        """Remove every cached vector store.
+
+        The cache directory is renamed aside and recreated empty, so callers
+        see it cleared at once; the old contents are deleted in a background
+        thread.
+        """
+        RAGHelper._stats_cache = None
+        if not RAGHelper.CACHE_DIR.exists():
+            return
+
+        trash_dir = RAGHelper.CACHE_DIR.with_name(
+            f"{RAGHelper.CACHE_DIR.name}.trash-{os.getpid()}-{time.time_ns()}"
+        )
+        with RAGHelper._cache_write_lock:
+            RAGHelper.CACHE_DIR.rename(trash_dir)
+            RAGHelper.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        threading.Thread(
+            target=shutil.rmtree,
+            args=(trash_dir,),
+            kwargs={"ignore_errors": True},
+            daemon=True,
+        ).start()
+
     @staticmethod
     def get_cache_statistics() -> Dict[str, Any]:
         """Get statistics about cached vector stores.
 
+        Results are reused for STATS_TTL_SECONDS unless a cache is written.
+
         Returns:
             Dictionary with cache statistics
         """
@@ -446,36 +909,13 @@ class RAGHelper:
                 "newest_cache": None,
             }
 
-        caches = []
-        total_size = 0
-
-        for cache_dir in RAGHelper.CACHE_DIR.iterdir():
-            if not cache_dir.is_dir():
-                continue
-
-            # Calculate size
-            cache_size = sum(
-                f.stat().st_size for f in cache_dir.rglob("*") if f.is_file()
-            )
-            total_size += cache_size
-
-            # Read metadata
-            metadata_file = cache_dir / "metadata.json"
-            if metadata_file.exists():
-                with open(metadata_file) as f:
-                    metadata = json.load(f)
-                    metadata["size_mb"] = cache_size / (1024 * 1024)
-                    caches.append(metadata)
-
-        caches.sort(key=lambda x: x["created_at"])
+        cached = RAGHelper._stats_cache
+        if cached is not None:
+            computed_at, stats = cached
+            if time.monotonic() - computed_at < RAGHelper.STATS_TTL_SECONDS:
+                return stats
 
-        return {
-            "total_caches": len(caches),
-            "total_size_mb": total_size / (1024 * 1024),
-            "oldest_cache": caches[0] if caches else None,
-            "newest_cache": caches[-1] if caches else None,
-            "caches": caches,
-        }
+        return RAGHelper._summarize_caches(RAGHelper._scan_caches())
 
     @staticmethod
     def save_file(file, folder: str = "tmp") -> str:
@@ -490,63 +930,201 @@ class RAGHelper:
         """
         os.makedirs(folder, exist_ok=True)
         file_path = os.path.join(folder, file.name)
+        # Copy in fixed-size chunks rather than materializing a second copy
+        file.seek(0)
         with open(file_path, "wb") as f:
-            f.write(file.getvalue())
+            shutil.copyfileobj(file, f, length=1 << 20)
+        file.seek(0)
         return file_path
 
     @staticmethod
-    def build_vectorstore(
-        files,
-        api_key: str = None,
-        anonymize_pii: bool = False,
-        pii_method: str = "replace",
-        pii_entities: Optional[List[str]] = None,
-        use_cache: bool = True,
-    ) -> Tuple[FAISS, List[Dict[str, Any]]]:
-        """Build FAISS vector store from uploaded PDF files with optional PII anonymization and caching.
-
-        Processes PDF files, optionally anonymizes PII, splits them into chunks,
-        creates embeddings, and builds a searchable vector database. Supports caching
-        for faster reloads.
+    def _load_pdf(file_path: str) -> List[Document]:
+        """Parse a saved PDF into one document per page.
 
         Args:
-            files: List of uploaded PDF files
-            api_key: Optional OpenAI API key for embeddings
-            anonymize_pii: Whether to detect and anonymize PII (default: False)
-            pii_method: Anonymization method - "replace", "mask", "hash", or "redact"
-            pii_entities: List of specific PII types to anonymize (None = all types)
-            use_cache: Whether to use caching (default: True)
+            file_path: Path to the PDF on local storage
 
         Returns:
-            Tuple of (FAISS vector store, list of all detected PII entities)
+            List of page documents
         """
-        # Generate cache key based on files and settings
-        if use_cache:
-            cache_key = RAGHelper._generate_cache_key(files, anonymize_pii, pii_method)
+        return PyPDFLoader(file_path).load()
 
-            # Try to load from cache
-            cached_result = RAGHelper._load_from_cache(cache_key, api_key)
-            if cached_result is not None:
-                return cached_result
+    @staticmethod
+    async def _embed_async(
+        embeddings: OpenAIEmbeddings, texts: List[str]
+    ) -> List[List[float]]:
+        """Embed texts with concurrent batched requests.
 
-        # Cache miss or caching disabled - build new vector store
-        documents: List[Document] = []
+        OpenAIEmbeddings sends its batches one after another; issuing them
+        concurrently overlaps the network round-trips. A semaphore bounds the
+        number of in-flight requests to stay within rate limits.
+
+        Args:
+            embeddings: Embeddings client to send the requests with
+            texts: Texts to embed
+
+        Returns:
+            One embedding vector per input text, in input order
+        """
+        semaphore = asyncio.Semaphore(RAGHelper.EMBED_CONCURRENCY)
+
+        async def embed_batch(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                return await embeddings.aembed_documents(batch)
+
+        size = RAGHelper.EMBED_BATCH_SIZE
+        batches = await asyncio.gather(
+            *(embed_batch(texts[i : i + size]) for i in range(0, len(texts), size))
+        )
+        return [vector for batch in batches for vector in batch]
+
+    @staticmethod
+    def _to_hnsw_index(vector_store: FAISS) -> None:
+        """Rebuild a vector store's flat index as an HNSW graph in place.
+
+        Flat search is linear in the number of vectors; HNSW gives sub-linear
+        approximate search with negligible recall loss. Small stores keep the
+        exact flat index, which is already fast and cheaper to build.
+
+        Args:
+            vector_store: FAISS vector store built with a flat index
+        """
+        index = vector_store.index
+        if index.ntotal < RAGHelper.HNSW_MIN_VECTORS:
+            return
+
+        hnsw_index = faiss.IndexHNSWFlat(index.d, RAGHelper.HNSW_M)
+        hnsw_index.hnsw.efConstruction = RAGHelper.HNSW_EF_CONSTRUCTION
+        hnsw_index.add(index.reconstruct_n(0, index.ntotal))
+        hnsw_index.hnsw.efSearch = RAGHelper.HNSW_EF_SEARCH
+        vector_store.index = hnsw_index
+
+    @staticmethod
+    def _to_ivfpq_index(vector_store: FAISS) -> None:
+        """Rebuild a vector store's flat index as a product-quantized IVF index.
+
+        Stores each vector as PQ_SUBQUANTIZERS bytes instead of full float32,
+        shrinking memory and cache size by an order of magnitude at a small
+        recall cost. Small stores keep the exact flat index.
+
+        Args:
+            vector_store: FAISS vector store built with a flat index
+        """
+        index = vector_store.index
+        if index.ntotal < RAGHelper.PQ_MIN_VECTORS:
+            return
+
+        vectors = index.reconstruct_n(0, index.ntotal)
+        nlist = max(32, int(index.ntotal**0.5))
+        quantizer = faiss.IndexFlatL2(index.d)
+        ivfpq_index = faiss.IndexIVFPQ(
+            quantizer, index.d, nlist, RAGHelper.PQ_SUBQUANTIZERS, RAGHelper.PQ_BITS
+        )
+        ivfpq_index.train(vectors)
+        ivfpq_index.add(vectors)
+        ivfpq_index.nprobe = RAGHelper.PQ_NPROBE
+        vector_store.index = ivfpq_index
+
+    @staticmethod
+    def _maybe_to_gpu(vector_store: FAISS) -> None:
+        """Move a vector store's index to the first GPU when one is available.
+
+        A no-op on faiss-cpu builds or machines without CUDA devices, and for
+        index types that have no GPU implementation (e.g. HNSW). Caches are
+        written before this is called, so the on-disk index stays CPU-based.
+
+        Args:
+            vector_store: FAISS vector store to move in place
+        """
+        if not hasattr(faiss, "StandardGpuResources") or faiss.get_num_gpus() == 0:
+            return
+
+        try:
+            resources = faiss.StandardGpuResources()
+            vector_store.index = faiss.index_cpu_to_gpu(
+                resources, 0, vector_store.index
+            )
+        except RuntimeError as e:
+            print(f"⚠️ Keeping vector index on CPU: {e}")
+
+    @staticmethod
+    def _check_cancelled(cancel_event: Optional[threading.Event]) -> None:
+        """Stop a build whose result is no longer wanted.
+
+        Args:
+            cancel_event: Event set by the caller to cancel, or None
+
+        Raises:
+            CancelledError: If the event is set
+        """
+        if cancel_event is not None and cancel_event.is_set():
+            raise CancelledError("Document processing was cancelled")
+
+    @staticmethod
+    def build_vectorstore(
+        files,
+        api_key: str = None,
+        anonymize_pii: bool = False,
+        pii_method: str = "replace",
+        pii_entities: Optional[List[str]] = None,
+        use_cache: bool = True,
+        quantize: bool = False,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> Tuple[FAISS, List[Dict[str, Any]]]:
+        """Build FAISS vector store from uploaded PDF files with optional PII anonymization and caching.
+
+        Processes PDF files, optionally anonymizes PII, splits them into chunks,
+        creates embeddings, and builds a searchable vector database. Supports caching
+        for faster reloads.
+
+        Args:
+            files: List of uploaded PDF files
+            api_key: Optional OpenAI API key for embeddings
+            anonymize_pii: Whether to detect and anonymize PII (default: False)
+            pii_method: Anonymization method - "replace", "mask", "hash", or "redact"
+            pii_entities: List of specific PII types to anonymize (None = all types)
+            use_cache: Whether to use caching (default: True)
+            quantize: Whether to compress large indexes with IVF-PQ (default: False)
+            cancel_event: Event that stops the build before the next file or
+                before embedding, raising CancelledError
+
+        Returns:
+            Tuple of (FAISS vector store, list of all detected PII entities)
+        """
+        # Generate cache key based on files and settings
+        if use_cache:
+            cache_key = RAGHelper._generate_cache_key(
+                files, anonymize_pii, pii_method, quantize
+            )
+
+            # Try to load from cache
+            cached_result = RAGHelper._load_from_cache(cache_key, api_key)
+            if cached_result is not None:
+                return cached_result
+
+        # Cache miss or caching disabled - build new vector store
+        documents: List[Document] = []
         all_pii_entities: List[Dict[str, Any]] = []
 
-        # Process each uploaded PDF file
         for file in files:
-            file_path = RAGHelper.save_file(file)
-            loader = PyPDFLoader(file_path)
-            loaded_docs = loader.load()
+            RAGHelper._check_cancelled(cancel_event)
+            loaded_docs = RAGHelper._load_pdf(RAGHelper.save_file(file))
 
             # Optionally anonymize PII in document content
             if anonymize_pii and PIIHelper.is_available():
-                for doc in loaded_docs:
+                # Detect across all pages in one batched spaCy pass, then
+                # anonymize each page without analyzing it again
+                entities_per_page = PIIHelper.detect_pii_batch(
+                    [doc.page_content for doc in loaded_docs],
+                    entities_to_detect=pii_entities,
+                )
+                for doc, page_entities in zip(loaded_docs, entities_per_page):
                     # Anonymize the document content
                     anonymized_text, detected_entities = PIIHelper.anonymize_text(
                         doc.page_content,
                         method=pii_method,
                         entities_to_anonymize=pii_entities,
+                        precomputed_entities=page_entities,
                     )
 
                     # Update document with anonymized content
@@ -566,13 +1144,31 @@ class RAGHelper:
         )
         document_chunks = text_splitter.split_documents(documents)
 
-        embeddings_kwargs = {}
-        if api_key:
-            embeddings_kwargs["api_key"] = api_key
-
         # Create embeddings and build vector store
-        embeddings = OpenAIEmbeddings(**embeddings_kwargs)
-        vector_store = FAISS.from_documents(document_chunks, embeddings)
+        RAGHelper._check_cancelled(cancel_event)
+        embeddings = RAGHelper._get_embeddings(api_key)
+        texts = [chunk.page_content for chunk in document_chunks]
+        if isinstance(embeddings, OpenAIEmbeddings):
+            # asyncio.run makes a new event loop per build, and async HTTP
+            # connections can't outlive their loop, so the concurrent
+            # requests get a client of their own
+            vectors = asyncio.run(
+                RAGHelper._embed_async(
+                    RAGHelper._get_embeddings(api_key, shared=False), texts
+                )
+            )
+        else:
+            # Local models batch internally; no network round-trips to overlap
+            vectors = embeddings.embed_documents(texts)
+        vector_store = FAISS.from_embeddings(
+            list(zip(texts, vectors)),
+            embeddings,
+            metadatas=[chunk.metadata for chunk in document_chunks],
+        )
+        if quantize:
+            RAGHelper._to_ivfpq_index(vector_store)
+        else:
+            RAGHelper._to_hnsw_index(vector_store)
 
         # Save to cache
         if use_cache:
@@ -580,6 +1176,8 @@ class RAGHelper:
                 "anonymize_pii": anonymize_pii,
                 "pii_method": pii_method,
                 "pii_entities": pii_entities,
+                "quantize": quantize,
+                "embedding_backend": RAGHelper.EMBEDDING_BACKEND,
             }
             RAGHelper._save_to_cache(
                 vector_store, all_pii_entities, cache_key, files, settings
@@ -587,6 +1185,50 @@ class RAGHelper:
 
         return vector_store, all_pii_entities
 
+    @staticmethod
+    def _get_encoding():
+        """Get or create singleton tokenizer for the generation model.
+
+        Returns:
+            tiktoken Encoding, or None if it could not be loaded
+        """
+        if RAGHelper._encoding is None:
+            try:
+                RAGHelper._encoding = tiktoken.encoding_for_model(
+                    RAGHelper.GENERATION_MODEL
+                )
+            except Exception as e:
+                print(f"⚠️ Tokenizer unavailable, context will not be budgeted: {e}")
+                RAGHelper._encoding = False
+
+        return RAGHelper._encoding or None
+
+    @staticmethod
+    def _fit_token_budget(docs: List[Document]) -> List[Document]:
+        """Keep the leading documents that fit within CONTEXT_TOKEN_BUDGET.
+
+        The most relevant document is always kept so a question with any
+        retrieval result still gets an answer.
+
+        Args:
+            docs: Retrieved documents, most relevant first
+
+        Returns:
+            Leading documents whose combined token count fits the budget
+        """
+        encoding = RAGHelper._get_encoding()
+        if encoding is None:
+            return docs
+
+        used_tokens = 0
+        for kept, doc in enumerate(docs):
+            used_tokens += len(encoding.encode_ordinary(doc.page_content))
+            if used_tokens > RAGHelper.CONTEXT_TOKEN_BUDGET and kept:
+                print(f"⚠️ Trimmed RAG context to {kept} of {len(docs)} chunks")
+                return docs[:kept]
+
+        return docs
+
     @staticmethod
     def build_simple_agentic_rag(retriever, llm: ChatOpenAI):
         """Build an intelligent agentic RAG workflow.
@@ -602,131 +1244,135 @@ class RAGHelper:
             Compiled LangGraph workflow for intelligent document QA
         """
 
-        # Classification node: determine if query needs summary or specific facts
-        SUMMARY_HINTS = (
-            "summarize",
-            "summary",
-            "overview",
-            "key points",
-            "bullet",
-            "synthesize",
-        )
-        FACT_HINTS = (
-            "when",
-            "date",
-            "who",
-            "where",
-            "amount",
-            "total",
-            "price",
-            "figure",
-            "specific",
-            "exact",
-        )
+        # Retrieval node: classify the query, then fetch documents for that mode
+        # (classification is a regex scan and doesn't warrant its own node)
+        def classify_and_retrieve(state: RAGHelper.RAGState) -> RAGHelper.RAGState:
+            """Classify query type and retrieve relevant documents for it."""
+            question = state["question"]
+            query_lower = question.lower()
+
+            # Summarize only when asked to and no specific fact is requested
+            mode: Literal["summary", "fact"] = (
+                "summary"
+                if RAGHelper._SUMMARY_PATTERN.search(query_lower)
+                and not RAGHelper._FACT_PATTERN.search(query_lower)
+                else "fact"
+            )
 
-        def classify_mode(state: RAGHelper.RAGState) -> RAGHelper.RAGState:
-            """Classify query type to determine appropriate response mode."""
-            query_lower = state["question"].lower()
+            # Adjust retrieval count based on response mode
+            num_docs = 8 if mode == "summary" else 3
+            retrieved_docs = RAGHelper._fit_token_budget(
+                retriever.invoke(question)[:num_docs]
+            )
 
-            # Determine response mode based on query keywords
-            if any(hint in query_lower for hint in SUMMARY_HINTS) and not any(
-                hint in query_lower for hint in FACT_HINTS
-            ):
-                mode: Literal["summary", "fact"] = "summary"
-            elif any(hint in query_lower for hint in FACT_HINTS):
-                mode = "fact"
-            else:
-                # Default to summary for general questions, fact for specific queries
-                mode = (
-                    "summary"
-                    if "summary" in query_lower or "summarize" in query_lower
-                    else "fact"
+            # Keep document order stable so overlapping retrievals share a
+            # prompt prefix (and hit the provider's prompt cache)
+            retrieved_docs.sort(
+                key=lambda doc: (
+                    doc.metadata.get("source", ""),
+                    doc.metadata.get("page", 0),
                 )
+            )
 
-            return {**state, "mode": mode}
-
-        # Retrieval node: fetch relevant documents based on query type
-        def retrieve(state: RAGHelper.RAGState) -> RAGHelper.RAGState:
-            """Retrieve relevant documents based on query and mode."""
-            question = state["question"]
-
-            # Adjust retrieval count based on response mode
-            num_docs = 8 if state["mode"] == "summary" else 3
-            retrieved_docs = retriever.invoke(question)
+            # Join the context once here so generate can use it as-is
+            context = "\n\n---\n\n".join(doc.page_content for doc in retrieved_docs)
 
-            return {**state, "documents": retrieved_docs[:num_docs]}
+            return {
+                **state,
+                "mode": mode,
+                "documents": retrieved_docs,
+                "context": context,
+            }
 
         # Generation node: create appropriate response based on mode and context
-        gen_prompt_summary = ChatPromptTemplate.from_messages(
-            [
-                (
-                    "system",
-                    "You are a helpful assistant. Create a concise, faithful summary ONLY using the provided context. "
-                    "Prefer bullet points if helpful. Do not use outside knowledge.",
-                ),
-                (
-                    "human",
-                    "Question:\n{question}\n\n"
-                    "Context (multiple document chunks):\n{context}\n\n"
-                    "Write a grounded summary:",
-                ),
-            ]
-        )
+        def generation_messages(state: RAGHelper.RAGState):
+            """Build the prompt for the state's mode, or None without context."""
+            document_context = state.get("context", "")
+            if not document_context.strip():
+                return None
 
-        gen_prompt_fact = ChatPromptTemplate.from_messages(
-            [
-                (
-                    "system",
-                    "You are a helpful assistant. Answer precisely and ONLY using the provided context. "
-                    "If the context is insufficient, say so.",
-                ),
-                ("human", "Question:\n{question}\n\nContext:\n{context}\n\nAnswer:"),
-            ]
+            prompt = RAGHelper._GEN_PROMPTS[state["mode"]]
+            return prompt.format_messages(
+                question=state["question"], context=document_context
+            )
+
+        no_context_answer = (
+            "I couldn't find enough information in the documents to answer that."
         )
 
         def generate(state: RAGHelper.RAGState) -> RAGHelper.RAGState:
             """Generate response based on retrieved documents and mode."""
-            # Combine retrieved document content
-            document_context = "\n\n---\n\n".join(
-                doc.page_content for doc in state.get("documents", [])
-            )
-
-            # Handle case where no relevant documents found
-            if not document_context.strip():
-                return {
-                    **state,
-                    "generation": "I couldn't find enough information in the documents to answer that.",
-                }
+            messages = generation_messages(state)
+            if messages is None:
+                return {**state, "generation": no_context_answer}
 
-            # Generate response using appropriate prompt based on mode
-            if state["mode"] == "summary":
-                response = llm.invoke(
-                    gen_prompt_summary.format_messages(
-                        question=state["question"], context=document_context
-                    )
-                )
-            else:
-                response = llm.invoke(
-                    gen_prompt_fact.format_messages(
-                        question=state["question"], context=document_context
-                    )
-                )
+            with RAGHelper._llm_slots:
+                response = llm.invoke(messages)
 
             return {**state, "generation": response.content}
 
         # Construct the workflow graph with connected nodes
         graph = StateGraph(RAGHelper.RAGState)
-        graph.add_node("classify_mode", classify_mode)
-        graph.add_node("retrieve", retrieve)
+        graph.add_node("retrieve", classify_and_retrieve)
         graph.add_node("generate", generate)
 
-        graph.set_entry_point("classify_mode")
-        graph.add_edge("classify_mode", "retrieve")
+        graph.set_entry_point("retrieve")
         graph.add_edge("retrieve", "generate")
         graph.add_edge("generate", END)
 
         return graph.compile()
 
+    @staticmethod
+    def new_answer_cache() -> Dict[str, Tuple[str, float]]:
+        """Create an empty answer cache.
+
+        Returns:
+            Dict of normalized question to (answer, time cached)
+        """
+        return {}
+
+    @staticmethod
+    def find_cached_answer(
+        cache: Dict[str, Tuple[str, float]], question: str
+    ) -> Optional[str]:
+        """Find a cached answer to the same question asked earlier.
+
+        Questions match after normalization only, so a question about a
+        different entity or number is never given another one's answer.
+
+        Args:
+            cache: Cache from new_answer_cache
+            question: User's question
+
+        Returns:
+            The cached answer if one is younger than ANSWER_CACHE_TTL_SECONDS,
+            None otherwise
+        """
+        entry = cache.get(_normalize_question(question))
+        if (
+            entry is not None
+            and time.time() - entry[1] < RAGHelper.ANSWER_CACHE_TTL_SECONDS
+        ):
+            return entry[0]
+        return None
+
+    @staticmethod
+    def add_cached_answer(
+        cache: Dict[str, Tuple[str, float]], question: str, answer: str
+    ) -> None:
+        """Store an answer in the cache, evicting the oldest entries.
+
+        Args:
+            cache: Cache from new_answer_cache
+            question: Answered question
+            answer: Generated answer to cache
+        """
+        key = _normalize_question(question)
+        cache.pop(key, None)
+        cache[key] = (answer, time.time())
+        while len(cache) > RAGHelper.ANSWER_CACHE_MAX_ENTRIES:
+            del cache[next(iter(cache))]
+
     @staticmethod
     def setup_rag_system(
         uploaded_files,
@@ -735,6 +1381,8 @@ class RAGHelper:
         pii_method: str = "replace",
         pii_entities: Optional[List[str]] = None,
         use_cache: bool = True,
+        quantize: bool = False,
+        cancel_event: Optional[threading.Event] = None,
     ) -> Tuple[Any, List[Dict[str, Any]]]:
         """Setup complete RAG system from uploaded files with optional PII anonymization and caching.
 
@@ -748,6 +1396,8 @@ class RAGHelper:
             pii_method: Anonymization method - "replace", "mask", "hash", or "redact"
             pii_entities: List of specific PII types to anonymize (None = all types)
             use_cache: Whether to use caching (default: True)
+            quantize: Whether to compress large indexes with IVF-PQ (default: False)
+            cancel_event: Event that cancels the build (see build_vectorstore)
 
         Returns:
             Tuple of (RAG workflow ready for query processing, list of detected PII entities)
@@ -763,14 +1413,19 @@ class RAGHelper:
             pii_method=pii_method,
             pii_entities=pii_entities,
             use_cache=use_cache,
+            quantize=quantize,
+            cancel_event=cancel_event,
         )
+        RAGHelper._maybe_to_gpu(vector_store)
         retriever = vector_store.as_retriever()
 
         # Configure language model for generation
         llm_config = {
-            "model": "gpt-4o-mini",
+            "model": RAGHelper.GENERATION_MODEL,
             "temperature": 0,  # Deterministic responses
             "streaming": False,
+            # Client-side jittered exponential backoff on 429/5xx responses
+            "max_retries": RAGHelper.LLM_MAX_RETRIES,
         }
         if api_key:
             llm_config["api_key"] = api_key
@@ -788,6 +1443,83 @@ class MCPHelper:
     specialized tools and resources beyond standard LLM capabilities.
     """
 
+    # One event loop for every MCP call, so the agent's async HTTP clients
+    # stay bound to a loop that outlives the Streamlit rerun
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _loop_lock = threading.Lock()
+
+    # Upper bounds on blocking the script thread for a hung MCP server
+    CONNECT_TIMEOUT_SECONDS = 30
+    QUERY_TIMEOUT_SECONDS = 120
+
+    @staticmethod
+    def _get_loop() -> asyncio.AbstractEventLoop:
+        """Get or start the background event loop thread.
+
+        Returns:
+            Event loop running forever on a daemon thread
+        """
+        if MCPHelper._loop is None or MCPHelper._loop.is_closed():
+            with MCPHelper._loop_lock:
+                if MCPHelper._loop is None or MCPHelper._loop.is_closed():
+                    loop = asyncio.new_event_loop()
+                    threading.Thread(
+                        target=loop.run_forever, name="mcp-event-loop", daemon=True
+                    ).start()
+                    MCPHelper._loop = loop
+
+        return MCPHelper._loop
+
+    @staticmethod
+    def _run_in_new_thread(coro: Any, timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on a short-lived thread with its own event loop.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait for the result, or None to wait forever
+
+        Returns:
+            The coroutine's result
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result(timeout)
+
+    @staticmethod
+    def run_async(coro: Any, timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the background MCP event loop.
+
+        Blocking on the background loop from its own thread would deadlock,
+        so calls made from that loop get a one-off thread and loop instead.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait for the result, or None to wait forever
+
+        Returns:
+            The coroutine's result
+
+        Raises:
+            TimeoutError: If the coroutine didn't finish within timeout seconds;
+                it is cancelled
+        """
+        loop = MCPHelper._get_loop()
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is loop:
+            return MCPHelper._run_in_new_thread(coro, timeout)
+
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(timeout)
+        except FuturesTimeoutError:
+            future.cancel()
+            raise TimeoutError(
+                f"MCP server did not respond within {timeout} seconds"
+            ) from None
+
     @staticmethod
     async def get_agent(openai_api_key: str, mcp_server_url: str):
         """Get or create an MCP agent instance.
@@ -812,13 +1544,13 @@ class MCPHelper:
             messages: List of conversation messages
 
         Returns:
-            Agent response as a string, or error message if processing fails
+            Agent response as a string
+
+        Raises:
+            Exception: Whatever the agent raised, e.g. when the MCP server is
+                unreachable, so callers can drop a dead cached agent
         """
-        try:
-            response_text = await agent.invoke(messages)
-            return response_text
-        except Exception as e:
-            return f"❌ MCP Agent Error: {str(e)}"
+        return await agent.invoke(messages)
 
 
 class PIIHelper:
@@ -829,8 +1561,51 @@ class PIIHelper:
     """
 
     _analyzer = None
+    _analyzer_lock = threading.Lock()
+    _regex_analyzer = None
     _anonymizer = None
-    _analyzer_available = None
+    _operators = None
+    # Probed without importing, so loading this module doesn't pay for the
+    # spaCy import; warm_up() or the first PII check does the actual import
+    _analyzer_available = (
+        importlib.util.find_spec("presidio_analyzer") is not None
+        and importlib.util.find_spec("presidio_anonymizer") is not None
+    )
+
+    # Analyzer results persisted across restarts, keyed by a hash of the text
+    # and parameters keyed with PII_CACHE_SECRET; only entity types, offsets
+    # and scores are stored, and nothing is written without the secret
+    RESULTS_CACHE_PATH = Path("tmp/pii_cache.sqlite")
+    RESULTS_CACHE_TTL_SECONDS = 24 * 60 * 60
+    _results_db = None
+    _results_hash_key = b""
+    _results_db_lock = threading.Lock()
+
+    # Entity types found by patterns/checksums alone; PHONE_NUMBER and US_SSN
+    # are left out since they rely on context words from the spaCy pass to
+    # clear the default threshold. Context words only raise scores, so these
+    # skip spaCy only when the threshold is at or below their base scores
+    # (see _analyzer_for)
+    _REGEX_ONLY_ENTITIES = frozenset(
+        {"EMAIL_ADDRESS", "CREDIT_CARD", "IP_ADDRESS", "URL", "IBAN_CODE"}
+    )
+
+    # Entity types whose every pattern needs a digit or an "@"; text with
+    # neither can't contain them. IP_ADDRESS and URL are left out since IPv6
+    # addresses and domains can be written without digits
+    _DIGIT_OR_AT_ENTITIES = frozenset(
+        {
+            "EMAIL_ADDRESS",
+            "CREDIT_CARD",
+            "IBAN_CODE",
+            "PHONE_NUMBER",
+            "US_SSN",
+            "US_ITIN",
+            "US_PASSPORT",
+            "US_BANK_NUMBER",
+        }
+    )
+    _DIGIT_OR_AT_PATTERN = re.compile(r"[\d@]")
 
     @staticmethod
     def _check_presidio_available() -> bool:
@@ -839,15 +1614,6 @@ class PIIHelper:
         Returns:
             True if Presidio is installed and available, False otherwise
         """
-        if PIIHelper._analyzer_available is None:
-            try:
-                from presidio_analyzer import AnalyzerEngine  # noqa: F401
-                from presidio_anonymizer import AnonymizerEngine  # noqa: F401
-
-                PIIHelper._analyzer_available = True
-            except ImportError:
-                PIIHelper._analyzer_available = False
-
         return PIIHelper._analyzer_available
 
     @staticmethod
@@ -868,12 +1634,118 @@ class PIIHelper:
             )
 
         if PIIHelper._analyzer is None:
-            from presidio_analyzer import AnalyzerEngine
+            # Serialize creation so the warm-up thread and a request don't
+            # both load the spaCy model
+            with PIIHelper._analyzer_lock:
+                if PIIHelper._analyzer is None:
+                    from presidio_analyzer import AnalyzerEngine
 
-            PIIHelper._analyzer = AnalyzerEngine()
+                    PIIHelper._analyzer = AnalyzerEngine()
+                    PIIHelper._analyze_cached.cache_clear()
 
         return PIIHelper._analyzer
 
+    @staticmethod
+    def warm_up() -> None:
+        """Load the analyzer ahead of the first request.
+
+        Meant to be run on a background thread by pages that use PII
+        features. Failures are ignored here; the first real call reports them.
+        """
+        try:
+            PIIHelper._get_analyzer()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _get_regex_analyzer():
+        """Get or create singleton AnalyzerEngine that skips the spaCy pass.
+
+        Returns:
+            Presidio AnalyzerEngine backed by a no-op NLP engine, or None if
+            the installed Presidio version has no such engine
+        """
+        if PIIHelper._regex_analyzer is None:
+            try:
+                from presidio_analyzer import AnalyzerEngine
+                from presidio_analyzer.nlp_engine import NoOpNlpEngine
+            except ImportError:
+                PIIHelper._regex_analyzer = False
+            else:
+                PIIHelper._regex_analyzer = AnalyzerEngine(
+                    nlp_engine=NoOpNlpEngine(
+                        models=[{"lang_code": "en", "model_name": "none"}]
+                    ),
+                    supported_languages=["en"],
+                )
+
+        return PIIHelper._regex_analyzer or None
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _regex_base_score(entities_key: Tuple[str, ...]) -> float:
+        """Get the lowest score the regex-only analyzer can report.
+
+        Recognizers with a validate_result check (Luhn, IBAN and email
+        checks) drop failed matches and score passing ones 1.0, so context
+        can't change them; the others report their pattern scores.
+
+        Args:
+            entities_key: Entity filter from _entities_key
+
+        Returns:
+            Lowest score across the recognizers for the requested types
+        """
+        from presidio_analyzer import EntityRecognizer, PatternRecognizer
+
+        scores = []
+        for recognizer in PIIHelper._get_regex_analyzer().registry.get_recognizers(
+            language="en", entities=list(entities_key)
+        ):
+            if (
+                type(recognizer).validate_result
+                is not PatternRecognizer.validate_result
+            ):
+                scores.append(EntityRecognizer.MAX_SCORE)
+            else:
+                scores.extend(pattern.score for pattern in recognizer.patterns)
+
+        return min(scores, default=EntityRecognizer.MIN_SCORE)
+
+    @staticmethod
+    def _analyzer_for(
+        entities_key: Optional[Tuple[str, ...]],
+        score_threshold: float,
+        language: str,
+    ) -> Any:
+        """Pick the analyzer for an entity filter.
+
+        The regex-only analyzer has no tokens to match context words
+        against, so matches it finds keep their base scores. It's only used
+        when every base score already clears score_threshold; then both
+        analyzers return the same matches.
+
+        Args:
+            entities_key: Entity filter from _entities_key
+            score_threshold: Minimum confidence score (0.0-1.0)
+            language: Language code
+
+        Returns:
+            The regex-only analyzer when every requested type is regex-only
+            and needs no context boost, otherwise the full spaCy-backed
+            analyzer
+        """
+        if (
+            entities_key
+            and language == "en"
+            and PIIHelper._REGEX_ONLY_ENTITIES.issuperset(entities_key)
+            and PIIHelper._get_regex_analyzer() is not None
+            and score_threshold <= PIIHelper._regex_base_score(entities_key)
+        ):
+            return PIIHelper._get_regex_analyzer()
+
+        return PIIHelper._get_analyzer()
+
     @staticmethod
     def _get_anonymizer():
         """Get or create singleton AnonymizerEngine instance.
@@ -897,6 +1769,71 @@ class PIIHelper:
 
         return PIIHelper._anonymizer
 
+    @staticmethod
+    def _get_operators(method: str) -> Dict[str, Any]:
+        """Get the anonymizer operator configs for a method.
+
+        The configs for every method are built once and shared across calls.
+
+        Args:
+            method: Anonymization method - "replace", "mask", "hash", or "redact"
+
+        Returns:
+            Mapping of entity type to Presidio OperatorConfig
+
+        Raises:
+            ValueError: If method is not a supported anonymization method
+        """
+        if PIIHelper._operators is None:
+            from presidio_anonymizer.entities import OperatorConfig
+
+            PIIHelper._operators = {
+                "replace": {
+                    "DEFAULT": OperatorConfig(
+                        "replace", {"new_value": "<{entity_type}>"}
+                    ),
+                    "PHONE_NUMBER": OperatorConfig("replace", {"new_value": "<PHONE>"}),
+                    "EMAIL_ADDRESS": OperatorConfig(
+                        "replace", {"new_value": "<EMAIL>"}
+                    ),
+                    "PERSON": OperatorConfig("replace", {"new_value": "<PERSON>"}),
+                    "CREDIT_CARD": OperatorConfig(
+                        "replace", {"new_value": "<CREDIT_CARD>"}
+                    ),
+                    "US_SSN": OperatorConfig("replace", {"new_value": "<SSN>"}),
+                    "LOCATION": OperatorConfig("replace", {"new_value": "<LOCATION>"}),
+                    "DATE_TIME": OperatorConfig("replace", {"new_value": "<DATE>"}),
+                    "US_DRIVER_LICENSE": OperatorConfig(
+                        "replace", {"new_value": "<DRIVER_LICENSE>"}
+                    ),
+                    "US_PASSPORT": OperatorConfig(
+                        "replace", {"new_value": "<PASSPORT>"}
+                    ),
+                    "MEDICAL_LICENSE": OperatorConfig(
+                        "replace", {"new_value": "<MEDICAL_LICENSE>"}
+                    ),
+                    "URL": OperatorConfig("replace", {"new_value": "<URL>"}),
+                    "IP_ADDRESS": OperatorConfig(
+                        "replace", {"new_value": "<IP_ADDRESS>"}
+                    ),
+                },
+                "mask": {
+                    "DEFAULT": OperatorConfig(
+                        "mask",
+                        {"chars_to_mask": 100, "masking_char": "*", "from_end": False},
+                    )
+                },
+                "hash": {"DEFAULT": OperatorConfig("hash", {"hash_type": "sha256"})},
+                "redact": {"DEFAULT": OperatorConfig("redact", {})},
+            }
+
+        try:
+            return PIIHelper._operators[method]
+        except KeyError:
+            raise ValueError(
+                f"Invalid anonymization method: {method}. Use 'replace', 'mask', 'hash', or 'redact'."
+            ) from None
+
     @staticmethod
     def detect_pii(
         text: str,
@@ -924,33 +1861,343 @@ class PIIHelper:
              {'type': 'EMAIL_ADDRESS', 'score': 1.0, 'start': 18, 'end': 35, 'text': 'john@example.com'}]
         """
         try:
-            analyzer = PIIHelper._get_analyzer()
+            results = PIIHelper._analyze_cached(
+                text,
+                PIIHelper._entities_key(entities_to_detect),
+                score_threshold,
+                language,
+            )
+            return PIIHelper._to_entity_dicts(text, results)
+
+        except Exception as e:
+            print(f"Error detecting PII: {e}")
+            return []
+
+    @staticmethod
+    def _entities_key(entities: Optional[List[str]]) -> Optional[Tuple[str, ...]]:
+        """Normalize an entity type filter into a hashable cache key.
+
+        Args:
+            entities: List of entity types (None or empty = all types)
+
+        Returns:
+            Sorted tuple of entity types, or None for all types
+        """
+        return tuple(sorted(entities)) if entities else None
+
+    @staticmethod
+    def _get_results_db() -> Optional[sqlite3.Connection]:
+        """Get or open the on-disk analyzer results cache.
+
+        The cache stays off unless PII_CACHE_SECRET is set, since its keys
+        are hashes of user text and must not be guessable without it.
+
+        Returns:
+            SQLite connection, or None if the cache is off or can't be opened
+        """
+        with PIIHelper._results_db_lock:
+            if PIIHelper._results_db is None:
+                PIIHelper._results_db = PIIHelper._open_results_db() or False
+
+        return PIIHelper._results_db or None
+
+    @staticmethod
+    def _open_results_db() -> Optional[sqlite3.Connection]:
+        """Open the results cache and load its hash key.
+
+        Returns:
+            SQLite connection, or None if the cache is off or can't be opened
+        """
+        secret = Config.get_api_key("PII_CACHE_SECRET", allow_user_input=False)
+        if not secret:
+            return None
+
+        try:
+            PIIHelper.RESULTS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(
+                str(PIIHelper.RESULTS_CACHE_PATH), check_same_thread=False
+            )
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(key TEXT PRIMARY KEY, created REAL, entities TEXT)"
+            )
+            db.execute(
+                "DELETE FROM results WHERE created < ?",
+                (time.time() - PIIHelper.RESULTS_CACHE_TTL_SECONDS,),
+            )
+            db.commit()
+            os.chmod(PIIHelper.RESULTS_CACHE_PATH, 0o600)
+        except (OSError, sqlite3.Error) as e:
+            print(f"PII results cache disabled: {e}")
+            return None
+
+        # blake2b keys are limited to 64 bytes, so hash the secret down first
+        PIIHelper._results_hash_key = hashlib.blake2b(
+            secret.encode("utf-8"), digest_size=32
+        ).digest()
+        return db
+
+    @staticmethod
+    def _results_cache_key(
+        text: str,
+        entities_key: Optional[Tuple[str, ...]],
+        score_threshold: float,
+        language: str,
+    ) -> str:
+        """Hash text and analyzer parameters into a results cache key.
+
+        Args:
+            text: Input text
+            entities_key: Entity filter from _entities_key
+            score_threshold: Minimum confidence score (0.0-1.0)
+            language: Language code
+
+        Returns:
+            Hex digest identifying the analysis
+        """
+        hasher = hashlib.blake2b(digest_size=20, key=PIIHelper._results_hash_key)
+        hasher.update(text.encode("utf-8"))
+        hasher.update(f"|{entities_key}|{score_threshold}|{language}".encode("utf-8"))
+        return hasher.hexdigest()
+
+    @staticmethod
+    def _load_cached_results(key: str) -> Optional[Tuple[Any, ...]]:
+        """Load analyzer results from the on-disk cache.
+
+        Args:
+            key: Key from _results_cache_key
+
+        Returns:
+            Tuple of Presidio RecognizerResult objects, or None on a miss
+        """
+        db = PIIHelper._get_results_db()
+        if db is None:
+            return None
+
+        try:
+            with PIIHelper._results_db_lock:
+                row = db.execute(
+                    "SELECT created, entities FROM results WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+
+        if row is None or time.time() - row[0] > PIIHelper.RESULTS_CACHE_TTL_SECONDS:
+            return None
+
+        from presidio_analyzer import RecognizerResult
+
+        return tuple(
+            RecognizerResult(entity_type, start, end, score)
+            for entity_type, start, end, score in _json_loads(row[1])
+        )
+
+    @staticmethod
+    def _store_cached_results(key: str, results: Tuple[Any, ...]) -> None:
+        """Save analyzer results to the on-disk cache.
+
+        Args:
+            key: Key from _results_cache_key
+            results: Presidio RecognizerResult objects to save
+        """
+        db = PIIHelper._get_results_db()
+        if db is None:
+            return
+
+        entities = [[r.entity_type, r.start, r.end, r.score] for r in results]
+        try:
+            with PIIHelper._results_db_lock:
+                db.execute(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?)",
+                    (key, time.time(), _json_dumps(entities)),
+                )
+                db.commit()
+        except sqlite3.Error as e:
+            print(f"Error caching PII results: {e}")
+
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _analyze_cached(
+        text: str,
+        entities_key: Optional[Tuple[str, ...]],
+        score_threshold: float,
+        language: str,
+    ) -> Tuple[Any, ...]:
+        """Run the analyzer on text, memoizing results for repeated inputs.
+
+        Streamlit reruns and repeated prompts re-check the same text; this
+        returns those results without another spaCy pass. With PII_CACHE_SECRET
+        set, results are also kept on disk, so text seen before a restart
+        skips the analyzer too.
+
+        Args:
+            text: Input text to analyze
+            entities_key: Entity filter from _entities_key
+            score_threshold: Minimum confidence score (0.0-1.0)
+            language: Language code
+
+        Returns:
+            Tuple of Presidio RecognizerResult objects
+        """
+        # Skip the analyzer when only digit/email entities were asked for
+        # and the text has neither
+        if (
+            entities_key
+            and PIIHelper._DIGIT_OR_AT_ENTITIES.issuperset(entities_key)
+            and not PIIHelper._DIGIT_OR_AT_PATTERN.search(text)
+        ):
+            return ()
+
+        cache_key = None
+        if PIIHelper._get_results_db() is not None:
+            cache_key = PIIHelper._results_cache_key(
+                text, entities_key, score_threshold, language
+            )
+            cached = PIIHelper._load_cached_results(cache_key)
+            if cached is not None:
+                return cached
 
-            # Analyze text for PII
-            results = analyzer.analyze(
+        analyzer = PIIHelper._analyzer_for(entities_key, score_threshold, language)
+        results = tuple(
+            analyzer.analyze(
                 text=text,
                 language=language,
+                entities=list(entities_key) if entities_key else None,
+                score_threshold=score_threshold,
+            )
+        )
+        if cache_key is not None:
+            PIIHelper._store_cached_results(cache_key, results)
+        return results
+
+    @staticmethod
+    def detect_pii_batch(
+        texts: List[str],
+        entities_to_detect: Optional[List[str]] = None,
+        language: str = "en",
+        score_threshold: float = 0.5,
+        batch_size: int = 64,
+    ) -> List[List[Dict[str, Any]]]:
+        """Detect PII entities in many texts at once.
+
+        Runs the spaCy pipeline over all texts with nlp.pipe (via Presidio's
+        BatchAnalyzerEngine), amortizing model overhead across the batch.
+
+        Args:
+            texts: Input texts to analyze
+            entities_to_detect: List of entity types to detect (None = all types)
+            language: Language code (default: "en")
+            score_threshold: Minimum confidence score (0.0-1.0)
+            batch_size: Number of texts per spaCy batch (default: 64)
+
+        Returns:
+            One list of detected entity dictionaries per input text
+        """
+        texts = list(texts)
+        try:
+            from presidio_analyzer import BatchAnalyzerEngine
+
+            entities_key = PIIHelper._entities_key(entities_to_detect)
+            batch_analyzer = BatchAnalyzerEngine(
+                analyzer_engine=PIIHelper._analyzer_for(
+                    entities_key, score_threshold, language
+                )
+            )
+
+            # Analyze texts for PII
+            batch_results = batch_analyzer.analyze_iterator(
+                texts,
+                language,
+                batch_size=batch_size,
                 entities=entities_to_detect,
                 score_threshold=score_threshold,
             )
 
-            # Convert results to structured format
-            detected_entities = [
-                {
-                    "type": result.entity_type,
-                    "score": result.score,
-                    "start": result.start,
-                    "end": result.end,
-                    "text": text[result.start : result.end],
-                }
-                for result in results
+            return [
+                PIIHelper._to_entity_dicts(text, results)
+                for text, results in zip(texts, batch_results)
             ]
 
-            return detected_entities
-
         except Exception as e:
             print(f"Error detecting PII: {e}")
-            return []
+            return [[] for _ in texts]
+
+    @staticmethod
+    def _to_entity_dicts(text: str, results: List[Any]) -> List[Dict[str, Any]]:
+        """Convert Presidio recognizer results to entity dictionaries.
+
+        Args:
+            text: Text the results were detected in
+            results: Presidio RecognizerResult list
+
+        Returns:
+            List of entity dictionaries with type, score, position, and text
+        """
+        return [
+            {
+                "type": result.entity_type,
+                "score": result.score,
+                "start": result.start,
+                "end": result.end,
+                "text": text[result.start : result.end],
+            }
+            for result in results
+        ]
+
+    @staticmethod
+    def _blank_spans(text: str, results: Any, method: str) -> Optional[str]:
+        """Mask or redact detected spans in one pass over the text.
+
+        Covers the common case of spans that don't overlap, where the
+        anonymizer's handling is simple: results on the same span keep the
+        highest score, and same-type entities separated only by spaces are
+        treated as one. Overlapping spans go through the anonymizer's conflict
+        resolution instead, so None is returned for them.
+
+        Args:
+            text: Text the results were detected in
+            results: Presidio RecognizerResult objects
+            method: "mask" or "redact"
+
+        Returns:
+            Text with each span masked or removed, or None if spans overlap
+        """
+        # Of results on the same span, the anonymizer keeps the highest score
+        best = {}
+        for result in results:
+            key = (result.start, result.end)
+            if key not in best or result.score >= best[key].score:
+                best[key] = result
+
+        spans = []
+        for result in sorted(best.values(), key=lambda r: (r.start, r.end)):
+            if spans and result.start < spans[-1][1]:
+                return None
+            if (
+                spans
+                and result.entity_type == spans[-1][2]
+                and result.start > spans[-1][1]
+                and not text[spans[-1][1] : result.start].strip(" ")
+            ):
+                spans[-1][1] = result.end
+            else:
+                spans.append([result.start, result.end, result.entity_type])
+
+        if method == "mask":
+            params = PIIHelper._get_operators("mask")["DEFAULT"].params
+            chars_to_mask = params["chars_to_mask"]
+            masking_char = params["masking_char"]
+
+        parts = []
+        cursor = 0
+        for start, end, _ in spans:
+            parts.append(text[cursor:start])
+            if method == "mask":
+                masked = min(end - start, chars_to_mask)
+                parts.append(masking_char * masked + text[start + masked : end])
+            cursor = end
+        parts.append(text[cursor:])
+        return "".join(parts)
 
     @staticmethod
     def anonymize_text(
@@ -958,6 +2205,7 @@ class PIIHelper:
         method: str = "replace",
         entities_to_anonymize: Optional[List[str]] = None,
         score_threshold: float = 0.5,
+        precomputed_entities: Optional[List[Dict[str, Any]]] = None,
     ) -> Tuple[str, List[Dict[str, Any]]]:
         """Detect and anonymize PII in text.
 
@@ -970,6 +2218,8 @@ class PIIHelper:
                 - redact: Remove completely
             entities_to_anonymize: List of entity types to anonymize (None = all)
             score_threshold: Minimum confidence score for detection (0.0-1.0)
+            precomputed_entities: Entities from detect_pii for this text; when
+                given, detection is skipped and these are anonymized as-is
 
         Returns:
             Tuple of (anonymized_text, detected_entities_list)
@@ -981,87 +2231,47 @@ class PIIHelper:
             "Call <PERSON> at <PHONE_NUMBER> or email <EMAIL_ADDRESS>"
         """
         try:
-            from presidio_anonymizer.entities import OperatorConfig
-
-            analyzer = PIIHelper._get_analyzer()
             anonymizer = PIIHelper._get_anonymizer()
 
-            # Detect PII entities
-            results = analyzer.analyze(
-                text=text,
-                language="en",
-                entities=entities_to_anonymize,
-                score_threshold=score_threshold,
-            )
+            if precomputed_entities is not None:
+                from presidio_analyzer import RecognizerResult
+
+                results = [
+                    RecognizerResult(e["type"], e["start"], e["end"], e["score"])
+                    for e in precomputed_entities
+                ]
+            else:
+                # Detect PII entities
+                results = PIIHelper._analyze_cached(
+                    text,
+                    PIIHelper._entities_key(entities_to_anonymize),
+                    score_threshold,
+                    "en",
+                )
 
             if not results:
                 return text, []
 
-            # Configure anonymization operators based on method
-            if method == "replace":
-                operators = {
-                    "DEFAULT": OperatorConfig(
-                        "replace", {"new_value": "<{entity_type}>"}
-                    ),
-                    "PHONE_NUMBER": OperatorConfig("replace", {"new_value": "<PHONE>"}),
-                    "EMAIL_ADDRESS": OperatorConfig(
-                        "replace", {"new_value": "<EMAIL>"}
-                    ),
-                    "PERSON": OperatorConfig("replace", {"new_value": "<PERSON>"}),
-                    "CREDIT_CARD": OperatorConfig(
-                        "replace", {"new_value": "<CREDIT_CARD>"}
-                    ),
-                    "US_SSN": OperatorConfig("replace", {"new_value": "<SSN>"}),
-                    "LOCATION": OperatorConfig("replace", {"new_value": "<LOCATION>"}),
-                    "DATE_TIME": OperatorConfig("replace", {"new_value": "<DATE>"}),
-                    "US_DRIVER_LICENSE": OperatorConfig(
-                        "replace", {"new_value": "<DRIVER_LICENSE>"}
-                    ),
-                    "US_PASSPORT": OperatorConfig(
-                        "replace", {"new_value": "<PASSPORT>"}
-                    ),
-                    "MEDICAL_LICENSE": OperatorConfig(
-                        "replace", {"new_value": "<MEDICAL_LICENSE>"}
-                    ),
-                    "URL": OperatorConfig("replace", {"new_value": "<URL>"}),
-                    "IP_ADDRESS": OperatorConfig(
-                        "replace", {"new_value": "<IP_ADDRESS>"}
-                    ),
-                }
-            elif method == "mask":
-                operators = {
-                    "DEFAULT": OperatorConfig(
-                        "mask",
-                        {"chars_to_mask": 100, "masking_char": "*", "from_end": False},
-                    )
-                }
-            elif method == "hash":
-                operators = {"DEFAULT": OperatorConfig("hash", {"hash_type": "sha256"})}
-            elif method == "redact":
-                operators = {"DEFAULT": OperatorConfig("redact", {})}
-            else:
-                raise ValueError(
-                    f"Invalid anonymization method: {method}. Use 'replace', 'mask', 'hash', or 'redact'."
-                )
+            operators = PIIHelper._get_operators(method)
 
-            # Anonymize text
-            anonymized_result = anonymizer.anonymize(
-                text=text, analyzer_results=results, operators=operators
-            )
+            # Anonymize text; masking and redaction only blank out spans, so
+            # they skip the anonymizer engine unless spans overlap
+            anonymized_text = None
+            if method in ("mask", "redact"):
+                anonymized_text = PIIHelper._blank_spans(text, results, method)
+            if anonymized_text is None:
+                anonymized_text = anonymizer.anonymize(
+                    text=text, analyzer_results=list(results), operators=operators
+                ).text
 
             # Extract detected entity information
-            detected_entities = [
-                {
-                    "type": result.entity_type,
-                    "score": result.score,
-                    "start": result.start,
-                    "end": result.end,
-                    "text": text[result.start : result.end],
-                }
-                for result in results
-            ]
+            detected_entities = (
+                precomputed_entities
+                if precomputed_entities is not None
+                else PIIHelper._to_entity_dicts(text, results)
+            )
 
-            return anonymized_result.text, detected_entities
+            return anonymized_text, detected_entities
 
         except Exception as e:
             print(f"Error anonymizing text: {e}")
@@ -1083,11 +2293,7 @@ class PIIHelper:
             >>> print(stats)
             {'PERSON': 2, 'EMAIL_ADDRESS': 1}
         """
-        stats = {}
-        for entity in entities:
-            entity_type = entity.get("type", "UNKNOWN")
-            stats[entity_type] = stats.get(entity_type, 0) + 1
-        return stats
+        return dict(Counter(entity.get("type", "UNKNOWN") for entity in entities))
 
     @staticmethod
     def format_pii_report(
@@ -1130,11 +2336,12 @@ class PIIHelper:
 
         if include_text:
             report.append("\nDetected Entities:")
-            for i, entity in enumerate(entities, 1):
-                report.append(
-                    f"{i}. {entity['type']} (score: {entity['score']:.2f}): "
-                    f"'{entity['text']}' at position {entity['start']}-{entity['end']}"
-                )
+            line = (
+                "{i}. {type} (score: {score:.2f}): '{text}' at position {start}-{end}"
+            ).format_map
+            report.extend(
+                line(dict(entity, i=i)) for i, entity in enumerate(entities, 1)
+            )
 
         return "\n".join(report)
 
@@ -1185,6 +2392,12 @@ class ValidationHelper:
     used throughout the application.
     """
 
+    # Accepted prefixes, compiled once; the pages call these on every
+    # Streamlit rerun
+    _OPENAI_KEY_PATTERN = re.compile(r"sk-")
+    _TAVILY_KEY_PATTERN = re.compile(r"tvly-")
+    _MCP_URL_PATTERN = re.compile(r"https?://")
+
     @staticmethod
     def validate_openai_key(api_key: str) -> bool:
         """Validate OpenAI API key format.
@@ -1195,7 +2408,9 @@ class ValidationHelper:
         Returns:
             True if key format is valid, False otherwise
         """
-        return api_key and api_key.startswith("sk-")
+        return bool(api_key) and bool(
+            ValidationHelper._OPENAI_KEY_PATTERN.match(api_key)
+        )
 
     @staticmethod
     def validate_tavily_key(api_key: str) -> bool:
@@ -1207,7 +2422,9 @@ class ValidationHelper:
         Returns:
             True if key format is valid, False otherwise
         """
-        return api_key and api_key.startswith("tvly-")
+        return bool(api_key) and bool(
+            ValidationHelper._TAVILY_KEY_PATTERN.match(api_key)
+        )
 
     @staticmethod
     def validate_mcp_url(url: str) -> bool:
@@ -1219,4 +2436,4 @@ class ValidationHelper:
         Returns:
             True if URL format is valid, False otherwise
         """
-        return url and (url.startswith("http://") or url.startswith("https://"))
+        return bool(url) and bool(ValidationHelper._MCP_URL_PATTERN.match(url))
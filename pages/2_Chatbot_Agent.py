@@ -7,14 +7,61 @@ for current information and real-time data queries.
 
 import streamlit as st
 import asyncio
+import queue
+import threading
 import time
-from typing import Any
+import weakref
+from typing import Any, Coroutine, Iterator
 
 from ui_components import ChatbotUI
 from langchain_helpers import AgentChatbotHelper, ValidationHelper
 from config import Config
 
 
+def _run_loop_until_stopped(loop: asyncio.AbstractEventLoop) -> None:
+    """Run an event loop on the current thread, closing it once stopped.
+
+    Args:
+        loop: Event loop to run
+    """
+    asyncio.set_event_loop(loop)
+    loop.run_forever()
+    loop.run_until_complete(loop.shutdown_asyncgens())
+    loop.close()
+
+
+class SessionEventLoop:
+    """Event loop running on a background thread for one browser session.
+
+    Every rerun of the session submits its coroutines here, so the agent's
+    async HTTP clients stay bound to one loop that is never driven from two
+    script threads at once. The loop is stopped and closed when this object
+    is garbage collected, i.e. once Streamlit discards the session's state.
+    """
+
+    def __init__(self) -> None:
+        """Start the loop on a daemon thread."""
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(
+            target=_run_loop_until_stopped,
+            args=(self.loop,),
+            name="agent-event-loop",
+            daemon=True,
+        ).start()
+        weakref.finalize(self, self.loop.call_soon_threadsafe, self.loop.stop)
+
+    def run(self, coro: Coroutine) -> Any:
+        """Run a coroutine on the session loop and wait for its result.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            The coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+
 def configure_api_keys() -> bool:
     """Configure OpenAI and Tavily API keys for the agent.
 
@@ -121,12 +168,80 @@ class ChatbotTools:
     def setup_agent(self) -> Any:
         """Setup the web search-enabled agent.
 
+        The agent is built once per key pair and kept in session state, so
+        reruns don't rebuild the LLM client, search tool and graph.
+
         Returns:
             Configured LangGraph agent with Tavily search tools
         """
         openai_key = st.session_state.get("agent_openai_key", "")
         tavily_key = st.session_state.get("agent_tavily_key", "")
-        return AgentChatbotHelper.setup_agent(openai_key, tavily_key)
+
+        # Rebuild only when the keys change
+        key_signature = hash((openai_key, tavily_key))
+        if (
+            "agent_obj" not in st.session_state
+            or st.session_state.get("agent_obj_sig") != key_signature
+        ):
+            st.session_state.agent_obj = AgentChatbotHelper.setup_agent(
+                openai_key, tavily_key
+            )
+            st.session_state.agent_obj_sig = key_signature
+        return st.session_state.agent_obj
+
+    def get_event_loop(self) -> SessionEventLoop:
+        """Get the session's background event loop for running the agent.
+
+        The loop is kept across messages so the HTTP clients bound to it can
+        reuse their open connections.
+
+        Returns:
+            Session event loop stored in session state
+        """
+        if "agent_loop" not in st.session_state:
+            st.session_state.agent_loop = SessionEventLoop()
+        return st.session_state.agent_loop
+
+    def stream_response(self, agent: Any, user_query: str) -> Iterator[str]:
+        """Stream the agent's response for st.write_stream.
+
+        The async token stream runs as one task on the session's event loop
+        and hands chunks over through a queue, so tokens render as they
+        arrive. If the script run is interrupted, the task is cancelled and
+        the stream is closed on its own loop, never from the script thread.
+
+        Args:
+            agent: Configured LangGraph agent
+            user_query: User's question
+
+        Yields:
+            Text deltas of the agent's response
+        """
+        chunks: queue.Queue = queue.Queue()
+        finished = object()
+
+        async def pump() -> None:
+            try:
+                async for text in AgentChatbotHelper.stream_agent_response(
+                    agent, user_query
+                ):
+                    chunks.put(text)
+            except Exception as e:
+                chunks.put(e)
+            finally:
+                chunks.put(finished)
+
+        task = asyncio.run_coroutine_threadsafe(pump(), self.get_event_loop().loop)
+        try:
+            while True:
+                chunk = chunks.get()
+                if chunk is finished:
+                    return
+                if isinstance(chunk, Exception):
+                    raise chunk
+                yield chunk
+        finally:
+            task.cancel()
 
     def display_messages(self) -> None:
         """Display chat messages with web search context awareness.
@@ -190,17 +305,31 @@ class ChatbotTools:
                         # Extract user query for web search processing
                         user_query = st.session_state.agent_messages[-1]["content"]
 
+                        # Reuse the answer if this exact question was asked
+                        response_cache = st.session_state.setdefault(
+                            "agent_response_cache", {}
+                        )
+                        response = AgentChatbotHelper.find_cached_response(
+                            response_cache, user_query
+                        )
+
                         # Process query through agent with search capabilities
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        try:
-                            response = loop.run_until_complete(
-                                AgentChatbotHelper.process_agent_response(
-                                    agent, user_query
+                        if response is None:
+                            response = st.write_stream(
+                                self.stream_response(agent, user_query)
+                            )
+
+                            # Fallback to direct invocation if nothing streamed
+                            if not response:
+                                response = self.get_event_loop().run(
+                                    AgentChatbotHelper.invoke_agent_response(
+                                        agent, user_query
+                                    )
                                 )
+
+                            AgentChatbotHelper.add_cached_response(
+                                response_cache, user_query, response
                             )
-                        finally:
-                            loop.close()
 
                         # Add assistant response
                         st.session_state.agent_messages.append(
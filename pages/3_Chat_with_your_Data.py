@@ -6,30 +6,36 @@ Features automatic document processing, vector search, and contextual responses.
 """
 
 import streamlit as st
+import copy
+import hashlib
+import threading
 import time
-from typing import List, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 
 from ui_components import ChatbotUI
 from langchain_helpers import RAGHelper, ValidationHelper, PIIHelper
 from config import Config
 
-
-def setup_page() -> None:
-    """Set up the RAG page with enhanced styling.
-
-    Configures page layout and applies custom CSS for document
-    upload interface and chat components.
-    """
-    st.set_page_config(
-        page_title="Chat with Documents",
-        page_icon="📄",
-        layout="wide",
-        initial_sidebar_state="collapsed",
-    )
-
-    # Enhanced visual styling
-    st.markdown(
-        """
+# Session state keys used by the RAG page and their initial values
+RAG_STATE_DEFAULTS: Dict[str, Any] = {
+    "rag_uploaded_files": [],
+    "rag_app": None,
+    "rag_messages": [],
+    "rag_anonymize_pii": False,
+    "rag_pii_method": "replace",
+    "rag_pii_entities": [],
+    "rag_detect_query_pii": True,
+    "rag_use_cache": True,
+    "rag_quantize": False,
+    "rag_app_by_fp": {},
+}
+
+# How often the processing status checks on a background document build
+SETUP_POLL_SECONDS = 0.5
+
+# Page CSS for the document upload interface and chat components
+PAGE_STYLE = """
     <style>
         /* Enhanced chat styling */
         .stChatMessage {
@@ -104,10 +110,36 @@ def setup_page() -> None:
             background: linear-gradient(135deg, #00d4aa, #00a883);
         }
     </style>
-    """,
-        unsafe_allow_html=True,
+    """
+
+
+@st.cache_resource(show_spinner=False)
+def start_pii_warm_up() -> None:
+    """Load the PII analyzer in the background, once per server process.
+
+    The spaCy model takes a few seconds to load; starting it when the page
+    opens keeps that off the first document upload or query check.
+    """
+    if PIIHelper.is_available():
+        threading.Thread(target=PIIHelper.warm_up, daemon=True).start()
+
+
+def setup_page() -> None:
+    """Set up the RAG page with enhanced styling.
+
+    Configures page layout and applies custom CSS for document
+    upload interface and chat components.
+    """
+    st.set_page_config(
+        page_title="Chat with Documents",
+        page_icon="📄",
+        layout="wide",
+        initial_sidebar_state="collapsed",
     )
 
+    # Enhanced visual styling
+    st.markdown(PAGE_STYLE, unsafe_allow_html=True)
+
 
 def configure_api_key() -> bool:
     """Configure OpenAI API key for RAG functionality.
@@ -174,36 +206,163 @@ class CustomDataChatbot:
     def __init__(self) -> None:
         """Initialize the RAG chatbot with default settings."""
         self.openai_model = "gpt-4o-mini"
+        # RAG apps kept per session for switching back to earlier uploads
+        self.max_built_apps = 3
+
+    def setup_graph(
+        self, uploaded_files: List[Any], fingerprint: str
+    ) -> Dict[str, Any]:
+        """Build the RAG graph from uploaded documents in a background thread.
 
-    def setup_graph(self, uploaded_files: List[Any]) -> Any:
-        """Setup RAG processing graph from uploaded documents with PII handling and caching.
+        PII and caching settings are read here, on the script thread, and the
+        build runs on a thread of its own so reruns can keep rendering the
+        page while documents are parsed and embedded. Each session has at
+        most one job; starting a new one cancels the previous build.
 
         Args:
             uploaded_files: List of Streamlit uploaded file objects
+            fingerprint: Fingerprint from fingerprint_files
 
         Returns:
-            Configured RAG workflow for document Q&A
+            Setup job for these files, with its fingerprint, start time, and a
+            future resolving to (RAG workflow, detected PII entities)
         """
+        job = st.session_state.get("rag_setup_job")
+        if job is not None and job["fingerprint"] == fingerprint:
+            return job
+        self.cancel_setup_job()
+
         api_key = st.session_state.get("rag_openai_key", "")
 
         # Get PII settings from session state
         anonymize_pii = st.session_state.get("rag_anonymize_pii", False)
         pii_method = st.session_state.get("rag_pii_method", "replace")
         use_cache = st.session_state.get("rag_use_cache", True)
-
-        # Setup RAG system with PII settings and caching
-        rag_app, pii_entities = RAGHelper.setup_rag_system(
+        quantize = st.session_state.get("rag_quantize", False)
+
+        # Setup RAG system with PII settings and caching on a dedicated
+        # thread; shutting the executor down right away lets that thread
+        # exit once the build finishes
+        cancel_event = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rag-setup")
+        future = executor.submit(
+            RAGHelper.setup_rag_system,
             uploaded_files,
             api_key,
             anonymize_pii=anonymize_pii,
             pii_method=pii_method,
             use_cache=use_cache,
+            quantize=quantize,
+            cancel_event=cancel_event,
+        )
+        executor.shutdown(wait=False)
+
+        job = {
+            "fingerprint": fingerprint,
+            "started": time.time(),
+            "future": future,
+            "cancel_event": cancel_event,
+        }
+        st.session_state.rag_setup_job = job
+        return job
+
+    @st.fragment(run_every=SETUP_POLL_SECONDS)
+    def show_setup_progress(self, processing_message: str) -> None:
+        """Show how long the pending build has run, polling until it ends.
+
+        Only this status area reruns while documents are processed; once
+        the build finishes (or is cancelled), the whole page reruns to pick
+        up the result.
+
+        Args:
+            processing_message: Status text shown before the elapsed time
+        """
+        job = st.session_state.get("rag_setup_job")
+        if job is None or job["future"].done():
+            st.rerun()
+
+        elapsed = time.time() - job["started"]
+        st.info(f"{processing_message}... ({elapsed:.0f}s)")
+
+    def cancel_setup_job(self, keep_fingerprint: Optional[str] = None) -> None:
+        """Cancel this session's pending build unless it is still wanted.
+
+        The build stops before its next file or before calling the
+        embeddings API, and its result is discarded.
+
+        Args:
+            keep_fingerprint: Fingerprint of the documents currently shown;
+                a job building exactly these is left running
+        """
+        job = st.session_state.get("rag_setup_job")
+        if job is None or job["fingerprint"] == keep_fingerprint:
+            return
+        job["cancel_event"].set()
+        job["future"].cancel()
+        del st.session_state.rag_setup_job
+
+    def fingerprint_files(self, uploaded_files: List[Any]) -> str:
+        """Fingerprint uploaded files by content and PII settings.
+
+        File contents are hashed once per upload; later reruns reuse the
+        digest stored for the same upload IDs.
+
+        Args:
+            uploaded_files: List of Streamlit uploaded file objects
+
+        Returns:
+            Hex digest identifying the documents and how they are processed
+        """
+        upload_ids = tuple(f.file_id for f in uploaded_files)
+        digests = st.session_state.setdefault("rag_file_digests", {})
+        if upload_ids not in digests:
+            hasher = hashlib.blake2b(digest_size=16)
+            for f in uploaded_files:
+                hasher.update(f.name.encode("utf-8"))
+                hasher.update(f.getvalue())
+            digests.clear()
+            digests[upload_ids] = hasher.hexdigest()
+
+        settings = (
+            f"{st.session_state.rag_anonymize_pii}|{st.session_state.rag_pii_method}"
+            f"|{st.session_state.rag_quantize}"
         )
+        return f"{digests[upload_ids]}:{settings}"
+
+    def remember_build(self, fingerprint: str, built: Tuple[Any, List]) -> None:
+        """Keep a built RAG app for reuse when the same files return.
+
+        Args:
+            fingerprint: Fingerprint from fingerprint_files
+            built: Tuple of (RAG workflow, detected PII entities)
+        """
+        built_apps = st.session_state.rag_app_by_fp
+        built_apps[fingerprint] = built
+        while len(built_apps) > self.max_built_apps:
+            del built_apps[next(iter(built_apps))]
 
-        # Store detected PII entities for reporting
-        st.session_state["rag_pii_entities"] = pii_entities
+    def stream_answer(
+        self, rag_inputs: Dict[str, Any], result: Dict[str, Any]
+    ) -> Iterator[str]:
+        """Stream the generated answer from the RAG workflow.
 
-        return rag_app
+        Args:
+            rag_inputs: Initial workflow state
+            result: Dict updated in place with the workflow's final state
+
+        Yields:
+            Text deltas from the generation step
+        """
+        for mode, payload in st.session_state.rag_app.stream(
+            rag_inputs, stream_mode=["messages", "values"]
+        ):
+            if mode == "values":
+                result.update(payload)
+                continue
+
+            chunk, metadata = payload
+            if metadata.get("langgraph_node") == "generate" and chunk.content:
+                yield chunk.content
 
     def display_messages(self) -> None:
         """Display document-aware chat messages.
@@ -211,16 +370,147 @@ class CustomDataChatbot:
         Shows conversation history with document context awareness
         and helpful prompts for document-based queries.
         """
-        if st.session_state.rag_messages:
-            for message in st.session_state.rag_messages:
-                if message["role"] == "user":
-                    with st.chat_message("user", avatar=ChatbotUI.get_user_avatar()):
-                        st.write(message["content"])
-                else:
-                    with st.chat_message(
-                        "assistant", avatar=ChatbotUI.get_bot_avatar()
-                    ):
-                        st.write(message["content"])
+        # Resolve avatars once per rerun rather than once per message, and
+        # render text with st.markdown directly instead of st.write's type
+        # dispatch
+        avatars = {
+            "user": ChatbotUI.get_user_avatar(),
+            "assistant": ChatbotUI.get_bot_avatar(),
+        }
+        for message in st.session_state.rag_messages:
+            role = "user" if message["role"] == "user" else "assistant"
+            with st.chat_message(role, avatar=avatars[role]):
+                st.markdown(message["content"])
+
+    def has_pending_question(self) -> bool:
+        """Check whether the last user message is still waiting for an answer.
+
+        Returns:
+            bool: True when the RAG app is ready and idle and the most recent
+            message came from the user
+        """
+        return bool(
+            st.session_state.rag_app
+            and st.session_state.rag_messages
+            and st.session_state.rag_messages[-1]["role"] == "user"
+            and not st.session_state.get("rag_processing", False)
+        )
+
+    def answer_pending_question(self) -> None:
+        """Answer the latest user message in place.
+
+        Renders the assistant bubble on the current script run and appends
+        the answer to the history, so no rerun is needed to show it.
+        """
+        # Set processing flag and timestamp
+        st.session_state.rag_processing = True
+        st.session_state.rag_processing_start = time.time()
+
+        # Show processing indicator; the placeholder ends up holding the answer
+        with st.chat_message("assistant", avatar=ChatbotUI.get_bot_avatar()):
+            placeholder = st.empty()
+            with st.spinner("Analyzing documents..."):
+                try:
+                    # Extract user query for document analysis
+                    user_query = st.session_state.rag_messages[-1]["content"]
+
+                    # Reuse the answer if this exact question was asked
+                    answer_cache = st.session_state.setdefault(
+                        "rag_answer_cache", RAGHelper.new_answer_cache()
+                    )
+                    answer = RAGHelper.find_cached_answer(answer_cache, user_query)
+
+                    if answer is None:
+                        rag_inputs = {
+                            "question": user_query,
+                            "mode": "fact",
+                            "documents": [],
+                            "generation": "",
+                        }
+
+                        # Process query through RAG workflow; stream tokens
+                        # unless the answer must pass the PII check first
+                        if st.session_state.rag_anonymize_pii:
+                            result = st.session_state.rag_app.invoke(rag_inputs)
+                        else:
+                            result = {}
+                            placeholder.write_stream(
+                                self.stream_answer(rag_inputs, result)
+                            )
+
+                        # Extract generated response with fallback
+                        answer = (
+                            result.get("generation", "").strip()
+                            or "I couldn't find enough information in the documents to answer that."
+                        )
+
+                        RAGHelper.add_cached_answer(answer_cache, user_query, answer)
+
+                    # SAFETY LAYER: Detect PII leakage in response
+                    # This catches any PII that might have slipped through if documents
+                    # were processed without anonymization enabled
+                    if st.session_state.rag_anonymize_pii and PIIHelper.is_available():
+                        response_pii = PIIHelper.detect_pii(answer, score_threshold=0.7)
+
+                        if response_pii:
+                            # PII detected in response - anonymize it as safety measure
+                            pii_types = list(set([e["type"] for e in response_pii]))
+
+                            # Anonymize the response
+                            anonymized_answer, _ = PIIHelper.anonymize_text(
+                                answer,
+                                method=st.session_state.rag_pii_method,
+                                score_threshold=0.7,
+                                precomputed_entities=response_pii,
+                            )
+
+                            # Add warning message
+                            warning_msg = (
+                                f"⚠️ **Privacy Alert**: Response contained {len(response_pii)} "
+                                f"potentially sensitive item(s) ({', '.join(pii_types)}) which have been anonymized.\n\n"
+                                f"**Note**: This suggests the document may have been uploaded without PII protection enabled. "
+                                f"For better privacy, please re-upload with PII anonymization enabled.\n\n"
+                                f"**Anonymized Response**:\n{anonymized_answer}"
+                            )
+                            answer = warning_msg
+
+                    # Add assistant response
+                    st.session_state.rag_messages.append(
+                        {"role": "assistant", "content": answer}
+                    )
+
+                    # Replace the streamed text or spinner with the final answer
+                    placeholder.markdown(answer)
+
+                    # Reset processing flag
+                    st.session_state.rag_processing = False
+                    st.session_state.rag_processing_start = 0
+
+                except Exception as e:
+                    # Always reset processing flag on error
+                    st.session_state.rag_processing = False
+                    st.session_state.rag_processing_start = 0
+                    placeholder.error(f"❌ Error: {str(e)}")
+
+                    # Add error message to chat
+                    st.session_state.rag_messages.append(
+                        {
+                            "role": "assistant",
+                            "content": f"I encountered an error: {str(e)}. Please try again.",
+                        }
+                    )
+
+    def show_query_pii_warning(self) -> None:
+        """Show the PII warning for the last query once, then clear it."""
+        if st.session_state.get("rag_last_query_pii"):
+            pii_info = st.session_state["rag_last_query_pii"]
+            st.warning(
+                f"⚠️ **PII Detected in Query**: Your question contains {pii_info['count']} "
+                f"potentially sensitive item(s): {', '.join(pii_info['types'])}\n\n"
+                f"Consider rephrasing to avoid including personal information."
+            )
+            # Clear the warning after showing
+            st.session_state["rag_last_query_pii"] = None
 
     def main(self) -> None:
         """Main RAG chatbot workflow.
@@ -228,23 +518,11 @@ class CustomDataChatbot:
         Manages document upload, processing, vector store creation,
         and intelligent question-answering over document content.
         """
-        # Initialize RAG-specific session state variables
-        if "rag_uploaded_files" not in st.session_state:
-            st.session_state.rag_uploaded_files = []
-        if "rag_app" not in st.session_state:
-            st.session_state.rag_app = None
-        if "rag_messages" not in st.session_state:
-            st.session_state.rag_messages = []
-        if "rag_anonymize_pii" not in st.session_state:
-            st.session_state.rag_anonymize_pii = False
-        if "rag_pii_method" not in st.session_state:
-            st.session_state.rag_pii_method = "replace"
-        if "rag_pii_entities" not in st.session_state:
-            st.session_state.rag_pii_entities = []
-        if "rag_detect_query_pii" not in st.session_state:
-            st.session_state.rag_detect_query_pii = True
-        if "rag_use_cache" not in st.session_state:
-            st.session_state.rag_use_cache = True
+        # Initialize RAG-specific session state variables; mutable defaults
+        # are copied so sessions don't share them
+        for key, default in RAG_STATE_DEFAULTS.items():
+            if key not in st.session_state:
+                st.session_state[key] = copy.copy(default)
 
         # PII Privacy & Caching Settings
         with st.expander("⚙️ Privacy & Performance Settings", expanded=False):
@@ -317,10 +595,20 @@ class CustomDataChatbot:
             )
             st.session_state.rag_use_cache = use_cache
 
+            # Index compression toggle
+            quantize = st.checkbox(
+                "Compress large document sets",
+                value=st.session_state.rag_quantize,
+                help=(
+                    "Store indexes of "
+                    f"{RAGHelper.PQ_MIN_VECTORS:,}+ chunks with product quantization; "
+                    "uses far less memory at a small cost in retrieval accuracy"
+                ),
+            )
+            st.session_state.rag_quantize = quantize
+
             if use_cache:
                 # Show cache statistics
-                from langchain_helpers import RAGHelper
-
                 cache_stats = RAGHelper.get_cache_statistics()
 
                 if cache_stats["total_caches"] > 0:
@@ -332,13 +620,9 @@ class CustomDataChatbot:
 
                     # Add clear cache button
                     if st.button("🗑️ Clear All Caches"):
-                        import shutil
-
-                        if RAGHelper.CACHE_DIR.exists():
-                            shutil.rmtree(RAGHelper.CACHE_DIR)
-                            RAGHelper.CACHE_DIR.mkdir(parents=True, exist_ok=True)
-                            st.success("✅ All caches cleared!")
-                            st.rerun()
+                        RAGHelper.clear_all_caches()
+                        st.success("✅ All caches cleared!")
+                        st.rerun()
                 else:
                     st.info(
                         "💡 No caches yet. Upload documents to create your first cache!"
@@ -362,23 +646,49 @@ class CustomDataChatbot:
         st.markdown("<br>", unsafe_allow_html=True)
 
         # Process documents when uploaded or changed
-        if uploaded_files:
-            current_files = {f.name for f in uploaded_files}
-            previous_files = {
-                f.name for f in st.session_state.get("rag_uploaded_files", [])
-            }
+        built = None
+        if not uploaded_files:
+            # Documents were removed; stop building them
+            self.cancel_setup_job()
+        else:
+            fingerprint = self.fingerprint_files(uploaded_files)
+
+            # Settings or files changed; stop building the old set
+            self.cancel_setup_job(keep_fingerprint=fingerprint)
 
             # Rebuild RAG system if files changed or system not initialized
-            if current_files != previous_files or st.session_state.rag_app is None:
+            if (
+                fingerprint != st.session_state.get("rag_fingerprint")
+                or st.session_state.rag_app is None
+            ):
+                # Same documents and settings as an earlier build
+                built = st.session_state.rag_app_by_fp.get(fingerprint)
+
+                if built is None:
+                    job = self.setup_graph(uploaded_files, fingerprint)
+                    if job["future"].done():
+                        del st.session_state.rag_setup_job
+                        try:
+                            built = job["future"].result()
+                            self.remember_build(fingerprint, built)
+                        except Exception as e:
+                            st.error(f"❌ Error processing documents: {str(e)}")
+                    else:
+                        # Hold queries until the new documents are ready
+                        st.session_state.rag_app = None
+
+                        processing_message = "📚 Processing documents"
+                        if st.session_state.rag_anonymize_pii:
+                            processing_message += " and detecting PII"
+                        self.show_setup_progress(processing_message)
+
+            if built is not None:
                 st.session_state.rag_uploaded_files = uploaded_files
+                st.session_state.rag_fingerprint = fingerprint
+                st.session_state.rag_app, st.session_state.rag_pii_entities = built
 
-                processing_message = "📚 Processing documents"
-                if st.session_state.rag_anonymize_pii:
-                    processing_message += " and detecting PII"
-                processing_message += "..."
-
-                with st.spinner(processing_message):
-                    st.session_state.rag_app = self.setup_graph(uploaded_files)
+                # Cached answers belong to the previous document set
+                st.session_state.rag_answer_cache = RAGHelper.new_answer_cache()
 
                 # Display PII detection report if PII was detected
                 if (
@@ -424,107 +734,11 @@ class CustomDataChatbot:
         self.display_messages()
 
         # Process document-based query and generate contextual response
-        if (
-            uploaded_files
-            and st.session_state.rag_app
-            and st.session_state.rag_messages
-            and st.session_state.rag_messages[-1]["role"] == "user"
-            and not st.session_state.get("rag_processing", False)
-        ):
-            # Set processing flag and timestamp
-            st.session_state.rag_processing = True
-            st.session_state.rag_processing_start = time.time()
-
-            # Show processing indicator
-            with st.chat_message("assistant", avatar=ChatbotUI.get_bot_avatar()):
-                with st.spinner("Analyzing documents..."):
-                    try:
-                        # Extract user query for document analysis
-                        user_query = st.session_state.rag_messages[-1]["content"]
-
-                        # Process query through RAG workflow
-                        result = st.session_state.rag_app.invoke(
-                            {
-                                "question": user_query,
-                                "mode": "fact",
-                                "documents": [],
-                                "generation": "",
-                            }
-                        )
-
-                        # Extract generated response with fallback
-                        answer = (
-                            result.get("generation", "").strip()
-                            or "I couldn't find enough information in the documents to answer that."
-                        )
-
-                        # SAFETY LAYER: Detect PII leakage in response
-                        # This catches any PII that might have slipped through if documents
-                        # were processed without anonymization enabled
-                        if (
-                            st.session_state.rag_anonymize_pii
-                            and PIIHelper.is_available()
-                        ):
-                            response_pii = PIIHelper.detect_pii(
-                                answer, score_threshold=0.7
-                            )
-
-                            if response_pii:
-                                # PII detected in response - anonymize it as safety measure
-                                pii_types = list(set([e["type"] for e in response_pii]))
-
-                                # Anonymize the response
-                                anonymized_answer, _ = PIIHelper.anonymize_text(
-                                    answer,
-                                    method=st.session_state.rag_pii_method,
-                                    score_threshold=0.7,
-                                )
-
-                                # Add warning message
-                                warning_msg = (
-                                    f"⚠️ **Privacy Alert**: Response contained {len(response_pii)} "
-                                    f"potentially sensitive item(s) ({', '.join(pii_types)}) which have been anonymized.\n\n"
-                                    f"**Note**: This suggests the document may have been uploaded without PII protection enabled. "
-                                    f"For better privacy, please re-upload with PII anonymization enabled.\n\n"
-                                    f"**Anonymized Response**:\n{anonymized_answer}"
-                                )
-                                answer = warning_msg
-
-                        # Add assistant response
-                        st.session_state.rag_messages.append(
-                            {"role": "assistant", "content": answer}
-                        )
-
-                        # Reset processing flag before rerun
-                        st.session_state.rag_processing = False
-                        st.session_state.rag_processing_start = 0
-                        st.rerun()
-
-                    except Exception as e:
-                        # Always reset processing flag on error
-                        st.session_state.rag_processing = False
-                        st.session_state.rag_processing_start = 0
-                        st.error(f"❌ Error: {str(e)}")
-
-                        # Add error message to chat
-                        st.session_state.rag_messages.append(
-                            {
-                                "role": "assistant",
-                                "content": f"I encountered an error: {str(e)}. Please try again.",
-                            }
-                        )
-                        st.rerun()
+        if uploaded_files and self.has_pending_question():
+            self.answer_pending_question()
 
         # Show query PII warning if it was detected in last query
-        if st.session_state.get("rag_last_query_pii"):
-            pii_info = st.session_state["rag_last_query_pii"]
-            st.warning(
-                f"⚠️ **PII Detected in Query**: Your question contains {pii_info['count']} "
-                f"potentially sensitive item(s): {', '.join(pii_info['types'])}\n\n"
-                f"Consider rephrasing to avoid including personal information."
-            )
-            # Clear the warning after showing
-            st.session_state["rag_last_query_pii"] = None
+        self.show_query_pii_warning()
 
         # Document query input interface
         if not uploaded_files:
@@ -537,7 +751,7 @@ class CustomDataChatbot:
                 query_pii_entities = PIIHelper.detect_pii(prompt, score_threshold=0.6)
 
                 if query_pii_entities:
-                    # Store PII detection info to show after rerun
+                    # Store PII detection info to show after the answer
                     pii_types = list(set([e["type"] for e in query_pii_entities]))
                     st.session_state["rag_last_query_pii"] = {
                         "count": len(query_pii_entities),
@@ -548,9 +762,15 @@ class CustomDataChatbot:
             else:
                 st.session_state["rag_last_query_pii"] = None
 
-            # Add user query to conversation history
+            # Add user query to conversation history and show it right away
             st.session_state.rag_messages.append({"role": "user", "content": prompt})
-            st.rerun()
+            with st.chat_message("user", avatar=ChatbotUI.get_user_avatar()):
+                st.write(prompt)
+
+            # Answer on this run instead of rerunning the whole page first
+            if self.has_pending_question():
+                self.answer_pending_question()
+            self.show_query_pii_warning()
 
 
 def main() -> None:
@@ -581,6 +801,9 @@ def main() -> None:
         return
 
     # Initialize and run the document-aware chatbot
+    # Start loading the PII analyzer while the user picks documents
+    start_pii_warm_up()
+
     app = CustomDataChatbot()
     app.main()
 
@@ -6,30 +6,24 @@ LLM functionality, enabling extensible and context-aware AI interactions.
 """
 
 import streamlit as st
-import asyncio
 import time
+from typing import Any
 
 from ui_components import ChatbotUI
 from langchain_helpers import MCPHelper, ValidationHelper
 from config import Config
 
 
-def setup_page() -> None:
-    """Set up the MCP agent page with enhanced styling.
+# Most recent messages sent to the agent each turn; older turns stay in the
+# on-screen history but no longer count toward the prompt
+MAX_CONTEXT_MESSAGES = 20
 
-    Configures page layout and applies custom CSS optimized
-    for MCP agent interactions and tool demonstrations.
-    """
-    st.set_page_config(
-        page_title="MCP Agent",
-        page_icon="🔧",
-        layout="wide",
-        initial_sidebar_state="collapsed",
-    )
+# Connected agents are dropped after this long, so a restarted MCP server
+# is picked up even if no call through the old agent ever fails
+AGENT_CACHE_TTL_SECONDS = 30 * 60
 
-    # Enhanced visual styling
-    st.markdown(
-        """
+# Page CSS for the MCP agent chat components
+PAGE_STYLE = """
     <style>
         /* Enhanced chat styling */
         .stChatMessage {
@@ -108,10 +102,25 @@ def setup_page() -> None:
             box-shadow: 0 2px 10px rgba(255, 107, 107, 0.2);
         }
     </style>
-    """,
-        unsafe_allow_html=True,
+    """
+
+
+def setup_page() -> None:
+    """Set up the MCP agent page with enhanced styling.
+
+    Configures page layout and applies custom CSS optimized
+    for MCP agent interactions and tool demonstrations.
+    """
+    st.set_page_config(
+        page_title="MCP Agent",
+        page_icon="🔧",
+        layout="wide",
+        initial_sidebar_state="collapsed",
     )
 
+    # Enhanced visual styling
+    st.markdown(PAGE_STYLE, unsafe_allow_html=True)
+
 
 def configure_mcp_settings() -> bool:
     """Configure OpenAI API key and MCP server URL.
@@ -206,6 +215,28 @@ def configure_mcp_settings() -> bool:
     return True
 
 
+@st.cache_resource(show_spinner=False, ttl=AGENT_CACHE_TTL_SECONDS)
+def get_cached_agent(openai_api_key: str, mcp_server_url: str) -> Any:
+    """Connect the MCP agent once per API key and server URL.
+
+    Tool discovery happens here, so later turns skip the MCP handshake.
+    Agents are reconnected after AGENT_CACHE_TTL_SECONDS, and callers drop
+    an agent early with get_cached_agent.clear() when a call through it
+    fails, e.g. after the MCP server restarted.
+
+    Args:
+        openai_api_key: OpenAI API key for LLM access
+        mcp_server_url: URL of the MCP server to connect to
+
+    Returns:
+        Initialized MCP agent shared across reruns and sessions
+    """
+    return MCPHelper.run_async(
+        MCPHelper.get_agent(openai_api_key, mcp_server_url),
+        timeout=MCPHelper.CONNECT_TIMEOUT_SECONDS,
+    )
+
+
 def display_messages() -> None:
     """Display MCP agent chat messages with capability awareness.
 
@@ -231,6 +262,94 @@ Ask me anything! I'm powered by Model Context Protocol.
                     st.write(message["content"])
 
 
+def has_pending_question() -> bool:
+    """Check whether the last user message is still waiting for an answer.
+
+    Returns:
+        True when the agent is idle and the most recent message came from
+        the user, False otherwise
+    """
+    return bool(
+        st.session_state.mcp_messages
+        and st.session_state.mcp_messages[-1]["role"] == "user"
+        and not st.session_state.get("mcp_processing", False)
+    )
+
+
+def answer_pending_question() -> None:
+    """Answer the latest user message through the MCP agent in place.
+
+    Renders the assistant bubble on the current script run and appends
+    the answer to the history, so no rerun is needed to show it.
+    """
+    # Set processing flag and timestamp
+    st.session_state.mcp_processing = True
+    st.session_state.mcp_processing_start = time.time()
+
+    # Show processing indicator; the placeholder ends up holding the answer
+    with st.chat_message("assistant", avatar=ChatbotUI.get_bot_avatar()):
+        placeholder = st.empty()
+        with st.spinner("Processing with MCP agent..."):
+            try:
+                # Retrieve configuration from session state
+                openai_api_key = st.session_state.get("mcp_openai_key", "")
+                mcp_server_url = st.session_state.get("mcp_server_url", "")
+
+                if openai_api_key and mcp_server_url:
+                    try:
+                        # Reuse the connected MCP agent from earlier turns
+                        agent = get_cached_agent(openai_api_key, mcp_server_url)
+
+                        # Format recent conversation history for agent processing
+                        formatted_messages = [
+                            {"role": msg["role"], "content": msg["content"]}
+                            for msg in st.session_state.mcp_messages[
+                                -MAX_CONTEXT_MESSAGES:
+                            ]
+                        ]
+
+                        # Process query on the agent's background event loop
+                        response_text = MCPHelper.run_async(
+                            MCPHelper.process_mcp_query(agent, formatted_messages),
+                            timeout=MCPHelper.QUERY_TIMEOUT_SECONDS,
+                        )
+
+                    except Exception as e:
+                        # The connection may be dead; reconnect next turn
+                        get_cached_agent.clear(openai_api_key, mcp_server_url)
+                        response_text = f"❌ MCP Agent Error: {str(e)}"
+                else:
+                    response_text = (
+                        "❌ Configuration missing. Please check API key and MCP URL."
+                    )
+
+                # Add assistant response
+                st.session_state.mcp_messages.append(
+                    {"role": "assistant", "content": response_text}
+                )
+
+                # Replace the spinner with the answer in place
+                placeholder.markdown(response_text)
+
+                # Reset processing flag
+                st.session_state.mcp_processing = False
+                st.session_state.mcp_processing_start = 0
+
+            except Exception as e:
+                # Always reset processing flag on error
+                st.session_state.mcp_processing = False
+                st.session_state.mcp_processing_start = 0
+                placeholder.error(f"❌ Error: {str(e)}")
+
+                # Add error message to chat
+                st.session_state.mcp_messages.append(
+                    {
+                        "role": "assistant",
+                        "content": f"I encountered an error: {str(e)}. Please try again.",
+                    }
+                )
+
+
 def main() -> None:
     """Main application function for the MCP agent page.
 
@@ -274,86 +393,19 @@ def main() -> None:
     display_messages()
 
     # Process query through MCP agent with tool access
-    if (
-        st.session_state.mcp_messages
-        and st.session_state.mcp_messages[-1]["role"] == "user"
-        and not st.session_state.get("mcp_processing", False)
-    ):
-        # Set processing flag and timestamp
-        st.session_state.mcp_processing = True
-        st.session_state.mcp_processing_start = time.time()
-
-        # Show processing indicator
-        with st.chat_message("assistant", avatar=ChatbotUI.get_bot_avatar()):
-            with st.spinner("Processing with MCP agent..."):
-                try:
-                    # Retrieve configuration from session state
-                    openai_api_key = st.session_state.get("mcp_openai_key", "")
-                    mcp_server_url = st.session_state.get("mcp_server_url", "")
-
-                    if openai_api_key and mcp_server_url:
-                        try:
-                            # Setup async event loop for MCP operations
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-
-                            try:
-                                # Initialize MCP agent with server connection
-                                agent = loop.run_until_complete(
-                                    MCPHelper.get_agent(openai_api_key, mcp_server_url)
-                                )
-
-                                # Format conversation history for agent processing
-                                formatted_messages = [
-                                    {"role": msg["role"], "content": msg["content"]}
-                                    for msg in st.session_state.mcp_messages
-                                ]
-
-                                # Process query through MCP agent
-                                response_text = loop.run_until_complete(
-                                    MCPHelper.process_mcp_query(
-                                        agent, formatted_messages
-                                    )
-                                )
-
-                            finally:
-                                loop.close()
-
-                        except Exception as e:
-                            response_text = f"❌ MCP Agent Error: {str(e)}"
-                    else:
-                        response_text = "❌ Configuration missing. Please check API key and MCP URL."
-
-                    # Add assistant response
-                    st.session_state.mcp_messages.append(
-                        {"role": "assistant", "content": response_text}
-                    )
-
-                    # Reset processing flag before rerun
-                    st.session_state.mcp_processing = False
-                    st.session_state.mcp_processing_start = 0
-                    st.rerun()
-
-                except Exception as e:
-                    # Always reset processing flag on error
-                    st.session_state.mcp_processing = False
-                    st.session_state.mcp_processing_start = 0
-                    st.error(f"❌ Error: {str(e)}")
-
-                    # Add error message to chat
-                    st.session_state.mcp_messages.append(
-                        {
-                            "role": "assistant",
-                            "content": f"I encountered an error: {str(e)}. Please try again.",
-                        }
-                    )
-                    st.rerun()
+    if has_pending_question():
+        answer_pending_question()
 
     # MCP agent query input interface
     if prompt := st.chat_input("Ask me anything..."):
-        # Add user message to MCP conversation history
+        # Add user message to MCP conversation history and show it right away
         st.session_state.mcp_messages.append({"role": "user", "content": prompt})
-        st.rerun()
+        with st.chat_message("user", avatar=ChatbotUI.get_user_avatar()):
+            st.write(prompt)
+
+        # Answer on this run instead of rerunning the whole page first
+        if has_pending_question():
+            answer_pending_question()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,82 @@
+"""Test that answer caches only reuse answers to the same question."""
+
+import time
+
+from langchain_helpers import AgentChatbotHelper, RAGHelper
+
+
+def test_agent_cache_serves_repeated_question():
+    """Case, spacing and trailing punctuation don't change the question."""
+    cache = {}
+    AgentChatbotHelper.add_cached_response(
+        cache, "What is the weather in Paris today?", "Sunny"
+    )
+
+    assert (
+        AgentChatbotHelper.find_cached_response(
+            cache, "  what is the weather in  Paris today "
+        )
+        == "Sunny"
+    )
+
+
+def test_agent_cache_misses_near_duplicate_questions():
+    """Questions differing by a place, year or ticker are not served."""
+    cache = {}
+    AgentChatbotHelper.add_cached_response(
+        cache, "What is the weather in Paris today?", "Sunny"
+    )
+    AgentChatbotHelper.add_cached_response(
+        cache, "Who won the World Cup in 2018?", "France"
+    )
+    AgentChatbotHelper.add_cached_response(
+        cache, "What is the AAPL stock price?", "$200"
+    )
+
+    for question in (
+        "What is the weather in Berlin today?",
+        "Who won the World Cup in 2022?",
+        "What is the MSFT stock price?",
+    ):
+        assert AgentChatbotHelper.find_cached_response(cache, question) is None
+
+
+def test_agent_cache_entries_expire(monkeypatch):
+    """Entries older than the TTL are not reused."""
+    cache = {}
+    AgentChatbotHelper.add_cached_response(cache, "Latest news?", "Old news")
+
+    later = time.time() + AgentChatbotHelper.RESPONSE_CACHE_TTL_SECONDS + 1
+    monkeypatch.setattr(time, "time", lambda: later)
+    assert AgentChatbotHelper.find_cached_response(cache, "Latest news?") is None
+
+
+def test_document_cache_misses_different_entity_questions():
+    """Document answers are only reused for the same question."""
+    cache = RAGHelper.new_answer_cache()
+    RAGHelper.add_cached_answer(
+        cache, "What is Sarah Johnson's date of birth?", "03/22/1978"
+    )
+    RAGHelper.add_cached_answer(cache, "What was revenue in Q3 2023?", "$4M")
+
+    assert (
+        RAGHelper.find_cached_answer(cache, "what is sarah johnson's date of birth")
+        == "03/22/1978"
+    )
+    for question in (
+        "What is John Johnson's date of birth?",
+        "What was revenue in Q3 2024?",
+        "What was revenue in Q4 2023?",
+    ):
+        assert RAGHelper.find_cached_answer(cache, question) is None
+
+
+def test_document_cache_evicts_oldest_entries(monkeypatch):
+    """The cache keeps only the newest ANSWER_CACHE_MAX_ENTRIES answers."""
+    monkeypatch.setattr(RAGHelper, "ANSWER_CACHE_MAX_ENTRIES", 2)
+    cache = RAGHelper.new_answer_cache()
+    for i in range(3):
+        RAGHelper.add_cached_answer(cache, f"Question {i}?", f"Answer {i}")
+
+    assert RAGHelper.find_cached_answer(cache, "Question 0?") is None
+    assert RAGHelper.find_cached_answer(cache, "Question 2?") == "Answer 2"
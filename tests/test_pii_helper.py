@@ -152,6 +152,122 @@ def test_document_scenario():
     print(f"\nStatistics: {stats}")
 
 
+def test_batch_detection():
+    """Test batched PII detection matches per-text detection."""
+    print("\n" + "=" * 60)
+    print("Testing Batch PII Detection")
+    print("=" * 60)
+
+    texts = [
+        "Email john@example.com for details.",
+        "Nothing sensitive in this sentence.",
+        "Server 192.168.1.20 belongs to Sarah Johnson.",
+    ]
+
+    if not PIIHelper.is_available():
+        print("❌ Presidio is not installed!")
+        return
+
+    batch_entities = PIIHelper.detect_pii_batch(texts)
+    assert len(batch_entities) == len(texts)
+
+    for text, entities in zip(texts, batch_entities):
+        assert entities == PIIHelper.detect_pii(text)
+        print(f"'{text}' -> {[e['type'] for e in entities]}")
+
+
+def test_blank_spans_match_anonymizer():
+    """Test mask/redact give the anonymizer's output, overlapping spans included."""
+    print("\n" + "=" * 60)
+    print("Testing Mask/Redact Against the Anonymizer Engine")
+    print("=" * 60)
+
+    if not PIIHelper.is_available():
+        print("❌ Presidio is not installed!")
+        return
+
+    from presidio_analyzer import RecognizerResult
+
+    text = "Call John Smith at 555-123-4567 or mail john@example.com today."
+    cases = {
+        "separate": [("PERSON", 5, 15, 0.85), ("PHONE_NUMBER", 19, 31, 0.75)],
+        "spaces between": [("PERSON", 5, 9, 0.85), ("PERSON", 10, 15, 0.85)],
+        "contained": [("PERSON", 5, 15, 0.85), ("PERSON", 10, 15, 0.6)],
+        "partial overlap": [("PERSON", 5, 15, 0.85), ("LOCATION", 10, 18, 0.6)],
+        "same span": [("EMAIL_ADDRESS", 40, 56, 1.0), ("URL", 40, 56, 0.5)],
+    }
+
+    for name, spans in cases.items():
+        entities = [
+            {"type": kind, "start": start, "end": end, "score": score}
+            for kind, start, end, score in spans
+        ]
+        for method in ("mask", "redact"):
+            anonymized, _ = PIIHelper.anonymize_text(
+                text, method=method, precomputed_entities=entities
+            )
+            expected = (
+                PIIHelper._get_anonymizer()
+                .anonymize(
+                    text=text,
+                    analyzer_results=[RecognizerResult(*span) for span in spans],
+                    operators=PIIHelper._get_operators(method),
+                )
+                .text
+            )
+            assert anonymized == expected, (name, method, anonymized, expected)
+        print(f"{name}: {anonymized!r}")
+
+
+def test_regex_analyzer_matches_full_analyzer():
+    """Test skipping spaCy never changes results, with or without context."""
+    print("\n" + "=" * 60)
+    print("Testing Regex-Only Analyzer Against the Full Analyzer")
+    print("=" * 60)
+
+    if not PIIHelper.is_available():
+        print("❌ Presidio is not installed!")
+        return
+
+    cases = [
+        (["CREDIT_CARD"], 0.7, "My credit card is 4111 1111 1111 1111."),
+        (["EMAIL_ADDRESS"], 0.5, "Email me at john@example.com."),
+        (["IP_ADDRESS"], 0.7, "The server ip address is 192.168.0.1."),
+        (["URL"], 0.7, "Our website link is example.com/docs."),
+    ]
+
+    # Luhn-checked cards score 1.0, so context can't lift them further
+    card = PIIHelper._get_regex_analyzer().analyze(
+        text=cases[0][2], language="en", entities=cases[0][0], score_threshold=0.7
+    )
+    assert [(r.entity_type, r.score) for r in card] == [("CREDIT_CARD", 1.0)], card
+
+    try:
+        full_analyzer = PIIHelper._get_analyzer()
+    except Exception as e:
+        print(f"Full analyzer unavailable, skipping comparison: {e}")
+        return
+
+    for entities, threshold, text in cases:
+        key = PIIHelper._entities_key(entities)
+        analyzer = PIIHelper._analyzer_for(key, threshold, "en")
+        got, expected = (
+            [
+                (r.entity_type, r.start, r.end, r.score)
+                for r in engine.analyze(
+                    text=text,
+                    language="en",
+                    entities=entities,
+                    score_threshold=threshold,
+                )
+            ]
+            for engine in (analyzer, full_analyzer)
+        )
+        assert got == expected, (entities, threshold, got, expected)
+        route = "full" if analyzer is full_analyzer else "regex-only"
+        print(f"{entities} at {threshold}: {route}, {got}")
+
+
 def test_supported_entities():
     """Display supported PII entity types."""
     print("\n" + "=" * 60)
@@ -161,10 +277,14 @@ def test_supported_entities():
     entities = PIIHelper.get_supported_entities()
     print(f"\nTotal supported entities: {len(entities)}\n")
 
-    # Display in columns
-    for i in range(0, len(entities), 3):
-        row = entities[i : i + 3]
-        print("  ".join(f"{entity:25}" for entity in row))
+    # Display in columns, padding the last row so every row fills the template
+    row_format = "{:25}  {:25}  {:25}"
+    padded = list(entities) + [""] * (-len(entities) % 3)
+    print(
+        "\n".join(
+            row_format.format(*padded[i : i + 3]) for i in range(0, len(padded), 3)
+        )
+    )
 
 
 def main():
@@ -178,6 +298,9 @@ def main():
     test_pii_anonymization()
     test_selective_anonymization()
     test_document_scenario()
+    test_batch_detection()
+    test_blank_spans_match_anonymizer()
+    test_regex_analyzer_matches_full_analyzer()
     test_supported_entities()
 
     print("\n" + "=" * 60)
@@ -5,7 +5,8 @@ integrated into the Chat with Your Data chatbot.
 """
 
 import sys
-from langchain_helpers import RAGHelper, PIIHelper
+
+from langchain_helpers import PIIHelper, RAGHelper
 
 
 def create_test_pdf_content() -> str:
@@ -169,8 +170,10 @@ def test_query_pii_detection():
     print("\nTesting queries for PII detection:")
     print("-" * 80)
 
-    for query in test_queries:
-        entities = PIIHelper.detect_pii(query, score_threshold=0.6)
+    # One spaCy pass over all queries instead of one per query
+    query_entities = PIIHelper.detect_pii_batch(test_queries, score_threshold=0.6)
+
+    for query, entities in zip(test_queries, query_entities):
         has_pii = "⚠️  HAS PII" if entities else "✅ Clean"
         entity_types = [e["type"] for e in entities] if entities else []
 
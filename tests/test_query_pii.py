@@ -14,11 +14,12 @@ test_queries = [
 print("Testing Query PII Detection:")
 print("=" * 60)
 
-for query in test_queries:
-    entities = PIIHelper.detect_pii(query, score_threshold=0.6)
+# One spaCy pass over all queries instead of one per query
+query_entities = PIIHelper.detect_pii_batch(test_queries, score_threshold=0.6)
 
+for query, entities in zip(test_queries, query_entities):
     if entities:
-        pii_types = list(set([e["type"] for e in entities]))
+        pii_types = sorted({e["type"] for e in entities})
         print("\n⚠️  PII DETECTED")
         print(f"Query: {query}")
         print(f"Found: {', '.join(pii_types)} ({len(entities)} entities)")
@@ -0,0 +1,52 @@
+"""Test that cached vector stores reload with their search settings."""
+
+from types import SimpleNamespace
+
+import faiss
+from langchain_community.vectorstores import FAISS
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from langchain_helpers import RAGHelper
+
+
+def _build_store(count: int) -> FAISS:
+    """Build a small flat-index vector store with fake embeddings."""
+    texts = [f"chunk {i}" for i in range(count)]
+    return FAISS.from_texts(texts, DeterministicFakeEmbedding(size=32))
+
+
+def _save_and_reload(vector_store: FAISS, tmp_path, monkeypatch) -> FAISS:
+    """Write a store to the cache and load it back."""
+    monkeypatch.setattr(RAGHelper, "CACHE_DIR", tmp_path)
+    files = [SimpleNamespace(name="doc.pdf", size=1)]
+    RAGHelper._save_to_cache(vector_store, [], "test-key", files, {})
+
+    loaded = RAGHelper._load_from_cache("test-key", "sk-test")
+    assert loaded is not None
+    return loaded[0]
+
+
+def test_hnsw_ef_search_survives_reload(tmp_path, monkeypatch):
+    """efSearch is not stored by FAISS and must be restored on load."""
+    monkeypatch.setattr(RAGHelper, "HNSW_MIN_VECTORS", 10)
+    vector_store = _build_store(50)
+    RAGHelper._to_hnsw_index(vector_store)
+    assert vector_store.index.hnsw.efSearch == RAGHelper.HNSW_EF_SEARCH
+
+    # Older FAISS releases read efSearch back as the default (16); write the
+    # default so the test covers that case on any version
+    vector_store.index.hnsw.efSearch = 16
+
+    index = _save_and_reload(vector_store, tmp_path, monkeypatch).index
+    assert isinstance(index, faiss.IndexHNSW)
+    assert index.hnsw.efSearch == RAGHelper.HNSW_EF_SEARCH
+
+
+def test_flat_index_reloads_unchanged(tmp_path, monkeypatch):
+    """Small stores keep the exact flat index across a reload."""
+    vector_store = _build_store(5)
+    RAGHelper._to_hnsw_index(vector_store)
+
+    index = _save_and_reload(vector_store, tmp_path, monkeypatch).index
+    assert index.ntotal == 5
+    assert not isinstance(index, faiss.IndexHNSW)